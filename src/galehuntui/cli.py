@@ -523,15 +523,18 @@ def tools_install(
         
         async def install_tools():
             results = {}
-            for tool in tool_list:
-                console.print(f"[cyan]Installing {tool}...[/cyan]")
-                try:
-                    path = await installer.install_tool(tool)
-                    console.print(f"[green]✓[/green] {tool} installed at {path}")
-                    results[tool] = path
-                except Exception as e:
-                    console.print(f"[red]✗[/red] {tool} failed: {e}")
-                    results[tool] = e
+            try:
+                for tool in tool_list:
+                    console.print(f"[cyan]Installing {tool}...[/cyan]")
+                    try:
+                        path = await installer.install_tool(tool)
+                        console.print(f"[green]✓[/green] {tool} installed at {path}")
+                        results[tool] = path
+                    except Exception as e:
+                        console.print(f"[red]✗[/red] {tool} failed: {e}")
+                        results[tool] = e
+            finally:
+                await installer.aclose()
             return results
         
         asyncio.run(install_tools())
@@ -573,13 +576,16 @@ def tools_update(
             raise typer.Exit(code=1)
         
         async def update_tools():
-            for tool in tool_list:
-                console.print(f"[cyan]Updating {tool}...[/cyan]")
-                try:
-                    path = await installer.install_tool(tool)
-                    console.print(f"[green]✓[/green] {tool} updated at {path}")
-                except Exception as e:
-                    console.print(f"[red]✗[/red] {tool} failed: {e}")
+            try:
+                for tool in tool_list:
+                    console.print(f"[cyan]Updating {tool}...[/cyan]")
+                    try:
+                        path = await installer.install_tool(tool)
+                        console.print(f"[green]✓[/green] {tool} updated at {path}")
+                    except Exception as e:
+                        console.print(f"[red]✗[/red] {tool} failed: {e}")
+            finally:
+                await installer.aclose()
         
         asyncio.run(update_tools())
         console.print("[green]✓[/green] Tools updated successfully")
@@ -49,7 +49,7 @@ class RunState(Enum):
 # Finding Model
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Normalized security finding from tool output.
     
@@ -92,6 +92,7 @@ class ToolResult:
     exit_code: int
     duration: float                         # Execution time in seconds
     output_path: Path                       # Path to raw output file
+    findings: Optional[list[Finding]] = None  # Set when parsed during execution
     
     @property
     def success(self) -> bool:
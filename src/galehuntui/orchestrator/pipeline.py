@@ -516,7 +516,11 @@ class PipelineOrchestrator:
                     outputs = self._parse_tool_output(result.stdout, tool_name)
                     all_outputs.extend(outputs)
                     
-                    findings = adapter.parse_output(result.stdout)
+                    # Adapters that parse while reading hand findings back directly
+                    if result.findings is not None:
+                        findings = result.findings
+                    else:
+                        findings = adapter.parse_output(result.stdout)
                     all_findings.extend(findings)
                     
                     if output_path is None:
@@ -13,6 +13,21 @@ from typing import Optional
 from galehuntui.core.exceptions import StorageError
 from galehuntui.core.models import Finding, PipelineStep, RunMetadata, Severity, Confidence, RunState
 from galehuntui.core.constants import StepStatus
+from galehuntui.core.utils import FindingCounts
+
+
+# SQL mirror of core.utils.classify_finding, so counts can be aggregated
+# without loading Finding objects. Keep the two in sync, and keep the
+# columns it reads covered by idx_findings_run_category (migration 003).
+_FINDING_CATEGORY_SQL = """
+    CASE
+        WHEN lower(type) IN ('subdomain', 'dns_record')
+            OR lower(tool) IN ('subfinder', 'dnsx') THEN 'subdomain'
+        WHEN lower(type) = 'http_probe' OR lower(tool) = 'httpx' THEN 'live_domain'
+        WHEN severity = 'info' THEN 'info'
+        ELSE 'findings'
+    END
+"""
 
 
 class Database:
@@ -59,13 +74,23 @@ class Database:
         """
         try:
             from galehuntui.storage.migrations.runner import MigrationRunner
-            from galehuntui.storage.migrations import m001_initial_schema, m002_add_steps_table
+            from galehuntui.storage.migrations import (
+                m001_initial_schema,
+                m002_add_steps_table,
+                m003_add_findings_category_index,
+            )
             
             conn = self._get_connection()
             
             runner = MigrationRunner(self.db_path)
             runner.register(1, "initial_schema", m001_initial_schema.up, m001_initial_schema.down)
             runner.register(2, "add_steps_table", m002_add_steps_table.up, m002_add_steps_table.down)
+            runner.register(
+                3,
+                "add_findings_category_index",
+                m003_add_findings_category_index.up,
+                m003_add_findings_category_index.down,
+            )
             
             runner.migrate(conn)
             
@@ -251,6 +276,94 @@ class Database:
         except (sqlite3.Error, ValueError) as e:
             raise StorageError(f"Failed to list runs: {e}") from e
     
+    def count_runs(self) -> int:
+        """Count all runs.
+        
+        Returns:
+            Total number of runs in the database
+            
+        Raises:
+            StorageError: If query fails
+        """
+        try:
+            conn = self._get_connection()
+            return conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+            
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to count runs: {e}") from e
+    
+    def get_finding_totals(self) -> FindingCounts:
+        """Count findings across all runs by category.
+        
+        Categories match core.utils.categorize_findings, but are computed
+        in a single aggregate query instead of loading every finding.
+        
+        Returns:
+            FindingCounts totalled over every run
+            
+        Raises:
+            StorageError: If query fails
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                f"SELECT {_FINDING_CATEGORY_SQL} AS category, COUNT(*) AS n "
+                "FROM findings GROUP BY category"
+            )
+            
+            counts = FindingCounts()
+            for row in cursor.fetchall():
+                setattr(counts, row["category"], row["n"])
+            return counts
+            
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to count findings: {e}") from e
+    
+    def get_finding_counts_by_run(self, run_ids: list[str]) -> dict[str, dict[str, int]]:
+        """Count findings per run by category in a single query.
+        
+        Args:
+            run_ids: Runs to count findings for
+            
+        Returns:
+            Dict mapping each run id to counts keyed "subdomain",
+            "live_domain", "findings", "info", plus "critical" and "high"
+            for vulnerability findings of that severity
+            
+        Raises:
+            StorageError: If query fails
+        """
+        counts = {
+            run_id: dict.fromkeys(
+                ("subdomain", "live_domain", "findings", "info", "critical", "high"), 0
+            )
+            for run_id in run_ids
+        }
+        if not run_ids:
+            return counts
+        
+        try:
+            conn = self._get_connection()
+            placeholders = ", ".join("?" * len(run_ids))
+            cursor = conn.execute(
+                f"SELECT run_id, {_FINDING_CATEGORY_SQL} AS category, severity, COUNT(*) AS n "
+                f"FROM findings WHERE run_id IN ({placeholders}) "
+                "GROUP BY run_id, category, severity",
+                run_ids,
+            )
+            
+            for row in cursor.fetchall():
+                run_counts = counts[row["run_id"]]
+                category = row["category"]
+                run_counts[category] += row["n"]
+                if category == "findings" and row["severity"] in ("critical", "high"):
+                    run_counts[row["severity"]] += row["n"]
+            
+            return counts
+            
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to count findings: {e}") from e
+    
     def save_finding(self, finding: Finding) -> None:
         """Save finding to database.
         
@@ -0,0 +1,24 @@
+"""Migration 003: Add covering index for finding category counts.
+
+The dashboard aggregates group findings by run and by a category derived
+from type, tool and severity. Indexing exactly those columns lets SQLite
+answer the counts from the index alone. If the category rules in
+database._FINDING_CATEGORY_SQL start reading other columns, extend this
+index to match.
+"""
+
+import sqlite3
+
+
+def up(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_findings_run_category
+        ON findings(run_id, type, tool, severity)
+    """)
+
+
+def down(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+    cursor.execute("DROP INDEX IF EXISTS idx_findings_run_category")
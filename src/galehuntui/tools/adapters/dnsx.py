@@ -151,7 +151,7 @@ class DnsxAdapter(ToolAdapterBase):
             
             # Save output to file
             output_path = Path(f"/tmp/dnsx_output_{uuid4().hex[:8]}.jsonl")
-            output_path.write_text(stdout)
+            await asyncio.to_thread(output_path.write_text, stdout)
             
             return ToolResult(
                 stdout=stdout,
@@ -141,7 +141,7 @@ class FfufAdapter(ToolAdapterBase):
             
             # Save output to file
             output_path = Path(f"/tmp/ffuf_output_{uuid4().hex[:8]}.json")
-            output_path.write_text(stdout)
+            await asyncio.to_thread(output_path.write_text, stdout)
             
             return ToolResult(
                 stdout=stdout,
@@ -147,7 +147,7 @@ class GauAdapter(ToolAdapterBase):
             
             # Save output to file
             output_path = Path(f"/tmp/gau_output_{uuid4().hex[:8]}.txt")
-            output_path.write_text(stdout)
+            await asyncio.to_thread(output_path.write_text, stdout)
             
             return ToolResult(
                 stdout=stdout,
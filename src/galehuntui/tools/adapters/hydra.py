@@ -146,7 +146,7 @@ class HydraAdapter(ToolAdapterBase):
             
             # Save output to file
             output_path = Path(f"/tmp/hydra_output_{uuid4().hex[:8]}.txt")
-            output_path.write_text(stdout)
+            await asyncio.to_thread(output_path.write_text, stdout)
             
             return ToolResult(
                 stdout=stdout,
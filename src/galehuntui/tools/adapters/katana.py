@@ -155,7 +155,7 @@ class KatanaAdapter(ToolAdapterBase):
             
             # Save output to file
             output_path = Path(f"/tmp/katana_output_{uuid4().hex[:8]}.jsonl")
-            output_path.write_text(stdout)
+            await asyncio.to_thread(output_path.write_text, stdout)
             
             return ToolResult(
                 stdout=stdout,
@@ -165,7 +165,7 @@ class NucleiAdapter(ToolAdapterBase):
             
             # Save output to file
             output_path = Path(f"/tmp/nuclei_output_{uuid4().hex[:8]}.jsonl")
-            output_path.write_text(stdout)
+            await asyncio.to_thread(output_path.write_text, stdout)
             
             return ToolResult(
                 stdout=stdout,
@@ -6,9 +6,10 @@ It supports detection and exploitation of SQL injection vulnerabilities.
 
 import asyncio
 import json
+import re
 import subprocess
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -24,6 +25,20 @@ from galehuntui.core.models import (
 from galehuntui.tools.base import ToolAdapterBase
 
 
+# Read size for draining SQLMap stdout in run()
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Lines sqlmap prints only once an injection is confirmed. Heuristic
+# ("might be injectable") and negative ("does not seem to be injectable",
+# "do not appear to be injectable") messages must never become findings.
+_DETECTION_RE = re.compile(
+    r"\bis vulnerable\b"
+    r"|\bappears to be\b.*\binjectable\b"
+    r"|identified the following injection point"
+)
+_NEGATION_RE = re.compile(r"\bnot\b")
+
+
 class SqlmapAdapter(ToolAdapterBase):
     """Adapter for SQLMap SQL injection scanner.
     
@@ -149,12 +164,30 @@ class SqlmapAdapter(ToolAdapterBase):
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={**config.env} if config.env else None,
+                env=config.env if config.env else None,
             )
             
+            output_path = self._new_output_path(".txt")
+            parser = _IncrementalSqlmapParser(self)
+            findings: list[Finding] = []
+            stdout_chunks: list[bytes] = []
+            
+            async def pump_stdout() -> None:
+                # Keep and parse each chunk as it arrives so the output is
+                # only traversed once
+                assert process.stdout is not None
+                while chunk := await process.stdout.read(_READ_CHUNK_SIZE):
+                    stdout_chunks.append(chunk)
+                    findings.extend(parser.feed(chunk))
+                findings.extend(parser.close())
+            
+            async def read_stderr() -> bytes:
+                assert process.stderr is not None
+                return await process.stderr.read()
+            
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(),
+                _, stderr_bytes, _ = await asyncio.wait_for(
+                    asyncio.gather(pump_stdout(), read_stderr(), process.wait()),
                     timeout=config.timeout,
                 )
             except asyncio.TimeoutError:
@@ -166,20 +199,20 @@ class SqlmapAdapter(ToolAdapterBase):
             
             duration = time.time() - start_time
             
+            stdout_bytes = b"".join(stdout_chunks)
+            await asyncio.to_thread(output_path.write_bytes, stdout_bytes)
+            
             stdout = stdout_bytes.decode("utf-8", errors="replace")
             stderr = stderr_bytes.decode("utf-8", errors="replace")
             exit_code = process.returncode or 0
             
-            # Save output to file
-            output_path = Path(f"/tmp/sqlmap_output_{uuid4().hex[:8]}.txt")
-            output_path.write_text(stdout)
-            
             return ToolResult(
                 stdout=stdout,
                 stderr=stderr,
                 exit_code=exit_code,
                 duration=duration,
                 output_path=output_path,
+                findings=findings,
             )
             
         except FileNotFoundError:
@@ -219,14 +252,15 @@ class SqlmapAdapter(ToolAdapterBase):
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={**config.env} if config.env else None,
+                env=config.env if config.env else None,
             )
             
             if process.stdout:
                 async for line in process.stdout:
-                    decoded_line = line.decode("utf-8", errors="replace").strip()
-                    if decoded_line:
-                        yield decoded_line
+                    line = line.rstrip(b"\r\n")
+                    if not line:
+                        continue
+                    yield line.decode("utf-8", errors="replace")
             
             await process.wait()
             
@@ -247,42 +281,18 @@ class SqlmapAdapter(ToolAdapterBase):
         Returns:
             List of normalized Finding objects
         """
-        findings = []
+        # Clean scans (the common case) contain no detection markers at all,
+        # so skip the line-by-line walk entirely
+        lowered = raw.lower()
+        if (
+            "vulnerable" not in lowered
+            and "injectable" not in lowered
+            and "injection point" not in lowered
+        ):
+            return []
         
-        # Parse SQLMap text output for vulnerability markers
-        lines = raw.split("\n")
-        
-        current_url = ""
-        current_param = ""
-        current_injection_type = ""
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Extract URL being tested
-            if "testing URL" in line.lower() or "target URL:" in line.lower():
-                parts = line.split("'")
-                if len(parts) >= 2:
-                    current_url = parts[1]
-            
-            # Extract parameter being tested
-            if "parameter:" in line.lower():
-                parts = line.split("'")
-                if len(parts) >= 2:
-                    current_param = parts[1]
-            
-            # Detect vulnerability
-            if "vulnerable" in line.lower() or "injectable" in line.lower():
-                if current_url:
-                    finding = self._create_finding_from_detection(
-                        url=current_url,
-                        parameter=current_param,
-                        detection_line=line,
-                    )
-                    if finding:
-                        findings.append(finding)
-        
-        return findings
+        parser = _IncrementalSqlmapParser(self)
+        return parser.parse_lines(raw.split("\n"))
     
     def _create_finding_from_detection(
         self,
@@ -388,3 +398,86 @@ class SqlmapAdapter(ToolAdapterBase):
             raise ToolExecutionError("SQLMap version check timed out")
         except Exception as e:
             raise ToolExecutionError(f"Failed to get SQLMap version: {e}")
+
+
+class _IncrementalSqlmapParser:
+    """Line-oriented SQLMap output parser that accepts arbitrary chunks.
+    
+    Keeps the tested URL/parameter context and any partial trailing line
+    between calls, so output can be parsed while it is being read.
+    
+    Args:
+        adapter: Adapter used to build findings from detection lines
+    """
+    
+    def __init__(self, adapter: SqlmapAdapter):
+        self._adapter = adapter
+        self._pending = b""
+        self._current_url = ""
+        self._current_param = ""
+    
+    def feed(self, chunk: bytes) -> list[Finding]:
+        """Parse all complete lines in a chunk of raw output.
+        
+        Args:
+            chunk: Raw bytes read from SQLMap stdout
+            
+        Returns:
+            Findings detected in the completed lines
+        """
+        lines = (self._pending + chunk).split(b"\n")
+        self._pending = lines.pop()
+        return self.parse_lines(
+            line.decode("utf-8", errors="replace") for line in lines
+        )
+    
+    def close(self) -> list[Finding]:
+        """Parse the final unterminated line, if any.
+        
+        Returns:
+            Findings detected in the remaining output
+        """
+        pending, self._pending = self._pending, b""
+        if not pending:
+            return []
+        return self.parse_lines([pending.decode("utf-8", errors="replace")])
+    
+    def parse_lines(self, lines: Iterable[str]) -> list[Finding]:
+        """Parse decoded output lines, updating the tracked context.
+        
+        Args:
+            lines: Decoded SQLMap output lines
+            
+        Returns:
+            Findings detected in the given lines
+        """
+        findings = []
+        
+        for line in lines:
+            line = line.strip()
+            lowered = line.lower()
+            
+            # Extract URL being tested
+            if "testing url" in lowered or "target url:" in lowered:
+                parts = line.split("'")
+                if len(parts) >= 2:
+                    self._current_url = parts[1]
+            
+            # Extract parameter being tested
+            if "parameter:" in lowered:
+                parts = line.split("'")
+                if len(parts) >= 2:
+                    self._current_param = parts[1]
+            
+            # Detect vulnerability
+            if _DETECTION_RE.search(lowered) and not _NEGATION_RE.search(lowered):
+                if self._current_url:
+                    finding = self._adapter._create_finding_from_detection(
+                        url=self._current_url,
+                        parameter=self._current_param,
+                        detection_line=line,
+                    )
+                    if finding:
+                        findings.append(finding)
+        
+        return findings
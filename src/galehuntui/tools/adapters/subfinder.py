@@ -125,7 +125,7 @@ class SubfinderAdapter(ToolAdapterBase):
                 stdin=asyncio.subprocess.PIPE if stdin_input else None,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={**config.env} if config.env else None,
+                env=config.env if config.env else None,
             )
             
             # Communicate with timeout
@@ -150,8 +150,8 @@ class SubfinderAdapter(ToolAdapterBase):
             exit_code = process.returncode or 0
             
             # Save output to file
-            output_path = Path(f"/tmp/subfinder_output_{uuid4().hex[:8]}.jsonl")
-            output_path.write_text(stdout)
+            output_path = self._new_output_path(".jsonl")
+            await asyncio.to_thread(output_path.write_text, stdout)
             
             return ToolResult(
                 stdout=stdout,
@@ -206,7 +206,7 @@ class SubfinderAdapter(ToolAdapterBase):
                 stdin=asyncio.subprocess.PIPE if stdin_input else None,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={**config.env} if config.env else None,
+                env=config.env if config.env else None,
             )
             
             # Send stdin if needed
@@ -218,9 +218,10 @@ class SubfinderAdapter(ToolAdapterBase):
             # Stream output line by line
             if process.stdout:
                 async for line in process.stdout:
-                    decoded_line = line.decode("utf-8", errors="replace").strip()
-                    if decoded_line:
-                        yield decoded_line
+                    line = line.rstrip(b"\r\n")
+                    if not line:
+                        continue
+                    yield line.decode("utf-8", errors="replace")
             
             await process.wait()
             
@@ -5,15 +5,23 @@ testing parameters, and brute-forcing various application components.
 """
 
 import asyncio
-import json
+import functools
+import os
+import re
 import subprocess
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from uuid import uuid4
+from urllib.parse import urlsplit
+from uuid import UUID, uuid4
 
+from galehuntui.core.exceptions import (
+    ToolExecutionError,
+    ToolNotFoundError,
+    ToolTimeoutError,
+)
 from galehuntui.core.models import (
     Finding,
     Severity,
@@ -23,6 +31,36 @@ from galehuntui.core.models import (
 )
 from galehuntui.tools.base import ToolAdapterBase
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is an optional speedup
+    import json as _json  # type: ignore[no-redef]
+
+
+# Read size for draining Wfuzz stdout in stream()
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+# First token after the word "wfuzz" in `wfuzz --version` output
+_VERSION_RE = re.compile(r"\S*wfuzz\S*\s+(\S+)", re.IGNORECASE)
+
+# Number of UUIDs drawn from a single os.urandom() call
+_UUID_BATCH_SIZE = 256
+
+
+def _iter_uuid4_strings() -> Iterator[str]:
+    # Equivalent to str(uuid4()) per item, but reads entropy in batches
+    while True:
+        pool = os.urandom(16 * _UUID_BATCH_SIZE)
+        for offset in range(0, len(pool), 16):
+            yield str(UUID(bytes=pool[offset:offset + 16], version=4))
+
+
+@functools.lru_cache(maxsize=4096)
+def _host_of(url: str) -> str:
+    # Fuzz results repeat the same few hosts, so memoize the parse
+    return urlsplit(url).netloc or url.split("/", 1)[0]
+
 
 class WfuzzAdapter(ToolAdapterBase):
     """Adapter for Wfuzz web application fuzzer.
@@ -40,6 +78,37 @@ class WfuzzAdapter(ToolAdapterBase):
     required = False
     mode_required = None
     
+    def __init__(self, bin_path: Path):
+        """Initialize Wfuzz adapter.
+        
+        Args:
+            bin_path: Path to directory containing tool binaries
+        """
+        super().__init__(bin_path)
+        self._version: Optional[str] = None
+    
+    # Response code -> (severity, confidence, finding type). Codes not listed
+    # fall back to the server-error entry (>= 500) or the default entry.
+    _STATUS_CLASSIFICATION: dict[int, tuple[Severity, Confidence, str]] = {
+        200: (Severity.LOW, Confidence.FIRM, "discovered-resource"),
+        301: (Severity.INFO, Confidence.TENTATIVE, "discovered-redirect"),
+        302: (Severity.INFO, Confidence.TENTATIVE, "discovered-redirect"),
+        307: (Severity.INFO, Confidence.TENTATIVE, "discovered-redirect"),
+        308: (Severity.INFO, Confidence.TENTATIVE, "discovered-redirect"),
+        401: (Severity.MEDIUM, Confidence.FIRM, "discovered-protected"),
+        403: (Severity.LOW, Confidence.FIRM, "discovered-forbidden"),
+    }
+    _SERVER_ERROR_CLASSIFICATION = (Severity.MEDIUM, Confidence.CONFIRMED, "server-error")
+    _DEFAULT_CLASSIFICATION = (Severity.INFO, Confidence.TENTATIVE, "discovered-resource")
+    
+    _REMEDIATION = (
+        "Review discovered resources to ensure they should be publicly accessible. "
+        "Remove or protect sensitive endpoints. Implement proper access controls."
+    )
+    _REFERENCES = (
+        "https://owasp.org/www-project-top-ten/2017/A6_2017-Security_Misconfiguration",
+    )
+    
     def build_command(
         self,
         inputs: list[str],
@@ -54,36 +123,66 @@ class WfuzzAdapter(ToolAdapterBase):
         Returns:
             Complete command arguments for Wfuzz execution
         """
-        cmd = [
+        cmd = list(self._build_prefix(
             str(self._get_tool_path()),
+            config.timeout,
+            config.rate_limit,
+            tuple(config.args),
+        ))
+        
+        # Add URL(s) - Wfuzz expects URL at the end
+        if len(inputs) >= 1:
+            # Wfuzz works on single URL with FUZZ keyword
+            cmd.append(inputs[0])
+        
+        return cmd
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_prefix(
+        tool_path: str,
+        timeout: Optional[int],
+        rate_limit: Optional[int],
+        args: tuple[str, ...],
+    ) -> tuple[str, ...]:
+        """Build the config-dependent part of the Wfuzz command.
+        
+        Cached because the same configuration is reused for every URL
+        fuzzed in a run; only the trailing URL differs between commands.
+        
+        Args:
+            tool_path: Path to the Wfuzz binary
+            timeout: Tool timeout in seconds
+            rate_limit: Requests per second
+            args: Custom arguments from the tool configuration
+            
+        Returns:
+            Command arguments preceding the target URL
+        """
+        cmd = [
+            tool_path,
             "-o", "json",  # JSON output format
         ]
         
         # Add timeout if specified (per request)
-        if config.timeout:
+        if timeout:
             # Wfuzz uses --conn-delay and --req-delay
-            timeout_per_request = min(config.timeout, 30)
+            timeout_per_request = min(timeout, 30)
             cmd.extend(["--conn-delay", str(timeout_per_request)])
         
         # Add rate limiting via threads and delay
-        if config.rate_limit:
+        if rate_limit:
             # Wfuzz uses -t for threads
-            threads = min(config.rate_limit, 50)  # Cap at 50 threads
+            threads = min(rate_limit, 50)  # Cap at 50 threads
             cmd.extend(["-t", str(threads)])
         
         # Hide common error codes (404, etc.) by default
         cmd.extend(["--hc", "404"])
         
         # Add any custom arguments from config (like -w for wordlist, -z for payload)
-        if config.args:
-            cmd.extend(config.args)
-        
-        # Add URL(s) - Wfuzz expects URL at the end
-        if len(inputs) >= 1:
-            # Wfuzz works on single URL with FUZZ keyword
-            cmd.append(inputs[0])
+        cmd.extend(args)
         
-        return cmd
+        return tuple(cmd)
     
     async def run(
         self,
@@ -104,12 +203,6 @@ class WfuzzAdapter(ToolAdapterBase):
             ToolTimeoutError: If execution exceeds timeout
             ToolExecutionError: If execution fails
         """
-        from galehuntui.core.exceptions import (
-            ToolNotFoundError,
-            ToolTimeoutError,
-            ToolExecutionError,
-        )
-        
         tool_path = self._get_tool_path()
         if not await self.check_available():
             raise ToolNotFoundError(f"Wfuzz not found at {tool_path}")
@@ -122,7 +215,7 @@ class WfuzzAdapter(ToolAdapterBase):
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={**config.env} if config.env else None,
+                env=config.env if config.env else None,
             )
             
             try:
@@ -143,9 +236,9 @@ class WfuzzAdapter(ToolAdapterBase):
             stderr = stderr_bytes.decode("utf-8", errors="replace")
             exit_code = process.returncode or 0
             
-            # Save output to file
-            output_path = Path(f"/tmp/wfuzz_output_{uuid4().hex[:8]}.json")
-            output_path.write_text(stdout)
+            # Save raw output bytes to file (no re-encode of the decoded text)
+            output_path = self._new_output_path(".json")
+            await asyncio.to_thread(output_path.write_bytes, stdout_bytes)
             
             return ToolResult(
                 stdout=stdout,
@@ -176,11 +269,6 @@ class WfuzzAdapter(ToolAdapterBase):
         Yields:
             JSON output lines from Wfuzz as they are produced
         """
-        from galehuntui.core.exceptions import (
-            ToolNotFoundError,
-            ToolExecutionError,
-        )
-        
         tool_path = self._get_tool_path()
         if not await self.check_available():
             raise ToolNotFoundError(f"Wfuzz not found at {tool_path}")
@@ -192,14 +280,24 @@ class WfuzzAdapter(ToolAdapterBase):
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={**config.env} if config.env else None,
+                env=config.env if config.env else None,
             )
             
             if process.stdout:
-                async for line in process.stdout:
-                    decoded_line = line.decode("utf-8", errors="replace").strip()
-                    if decoded_line:
-                        yield decoded_line
+                # Read in large chunks and split locally rather than awaiting
+                # readline() once per result line
+                pending = b""
+                while chunk := await process.stdout.read(_READ_CHUNK_SIZE):
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    for line in lines:
+                        decoded_line = line.decode("utf-8", errors="replace").strip()
+                        if decoded_line:
+                            yield decoded_line
+                
+                decoded_line = pending.decode("utf-8", errors="replace").strip()
+                if decoded_line:
+                    yield decoded_line
             
             await process.wait()
             
@@ -220,37 +318,57 @@ class WfuzzAdapter(ToolAdapterBase):
         Returns:
             List of normalized Finding objects
         """
-        findings = []
+        return list(self.parse_output_stream(raw))
+    
+    def parse_output_stream(self, raw: str) -> Iterator[Finding]:
+        """Parse Wfuzz JSON output, yielding findings one at a time.
         
+        Findings are built on demand, so callers that only iterate over the
+        results never hold the full list of Finding objects in memory.
+        
+        Args:
+            raw: Raw JSON output from Wfuzz
+            
+        Yields:
+            Normalized Finding objects
+        """
         # Wfuzz JSON can be a list of results or JSONL
         try:
-            # Try parsing as JSON array first
-            data = json.loads(raw)
-            if isinstance(data, list):
-                for result in data:
-                    finding = self._convert_to_finding(result)
-                    if finding:
-                        findings.append(finding)
-            else:
-                # Single result
-                finding = self._convert_to_finding(data)
-                if finding:
-                    findings.append(finding)
-        except json.JSONDecodeError:
-            # Try parsing as JSON Lines
-            json_objects = self._parse_json_lines(raw)
-            for data in json_objects:
-                finding = self._convert_to_finding(data)
-                if finding:
-                    findings.append(finding)
-        
-        return findings
+            # Try parsing as JSON array (or a single result) first
+            data = _json.loads(raw)
+        except ValueError:
+            # Not a single JSON document (both decoders raise ValueError
+            # subclasses); try parsing as JSON Lines
+            results = self._parse_json_lines(raw)
+        else:
+            results = data if isinstance(data, list) else [data]
+        
+        # One timestamp and one pooled entropy source for the whole batch
+        now = datetime.now()
+        finding_ids = _iter_uuid4_strings()
+        
+        for result in results:
+            finding = self._convert_to_finding(
+                result,
+                timestamp=now,
+                finding_id=next(finding_ids),
+            )
+            if finding:
+                yield finding
     
-    def _convert_to_finding(self, data: dict) -> Optional[Finding]:
+    def _convert_to_finding(
+        self,
+        data: dict,
+        *,
+        timestamp: Optional[datetime] = None,
+        finding_id: Optional[str] = None,
+    ) -> Optional[Finding]:
         """Convert Wfuzz JSON result to Finding object.
         
         Args:
             data: Parsed JSON object from Wfuzz output
+            timestamp: Finding timestamp (defaults to now)
+            finding_id: Finding ID (defaults to a fresh UUID4)
             
         Returns:
             Finding object or None
@@ -277,40 +395,26 @@ class WfuzzAdapter(ToolAdapterBase):
                 return None
             
             # Extract host
-            host = url.split("//")[-1].split("/")[0] if "//" in url else url.split("/")[0]
+            host = _host_of(url)
             
-            # Determine severity based on response code and content
-            severity = Severity.INFO
-            confidence = Confidence.TENTATIVE
-            finding_type = "discovered-resource"
-            
-            # Interesting responses that might indicate vulnerabilities
-            if code == 200:
-                severity = Severity.LOW
-                confidence = Confidence.FIRM
-            elif code in [301, 302, 307, 308]:
-                severity = Severity.INFO
-                finding_type = "discovered-redirect"
-            elif code == 403:
-                severity = Severity.LOW
-                finding_type = "discovered-forbidden"
-                confidence = Confidence.FIRM
-            elif code == 401:
-                severity = Severity.MEDIUM
-                finding_type = "discovered-protected"
-                confidence = Confidence.FIRM
-            elif code >= 500:
-                severity = Severity.MEDIUM
-                finding_type = "server-error"
-                confidence = Confidence.CONFIRMED
+            # Determine severity based on response code
+            classification = self._STATUS_CLASSIFICATION.get(code)
+            if classification is None:
+                classification = (
+                    self._SERVER_ERROR_CLASSIFICATION if code >= 500
+                    else self._DEFAULT_CLASSIFICATION
+                )
+            severity, confidence, finding_type = classification
             
             title = f"Resource discovered via {self.name}: {payload}"
-            description = f"Fuzzing discovered resource at {url} with HTTP {code}. "
-            description += f"Response size: {chars} chars, {lines} lines, {words} words. "
-            description += f"Payload used: {payload}"
+            description = (
+                f"Fuzzing discovered resource at {url} with HTTP {code}. "
+                f"Response size: {chars} chars, {lines} lines, {words} words. "
+                f"Payload used: {payload}"
+            )
             
             finding = Finding(
-                id=str(uuid4()),
+                id=finding_id or str(uuid4()),
                 run_id="",
                 type=finding_type,
                 severity=severity,
@@ -320,7 +424,7 @@ class WfuzzAdapter(ToolAdapterBase):
                 parameter=None,
                 evidence_paths=[],
                 tool=self.name,
-                timestamp=datetime.now(),
+                timestamp=timestamp or datetime.now(),
                 title=title,
                 description=description,
                 reproduction_steps=[
@@ -330,10 +434,8 @@ class WfuzzAdapter(ToolAdapterBase):
                     f"Response: {lines} lines, {words} words, {chars} chars",
                     "Access the URL directly to verify",
                 ],
-                remediation="Review discovered resources to ensure they should be publicly accessible. Remove or protect sensitive endpoints. Implement proper access controls.",
-                references=[
-                    "https://owasp.org/www-project-top-ten/2017/A6_2017-Security_Misconfiguration",
-                ],
+                remediation=self._REMEDIATION,
+                references=list(self._REFERENCES),
             )
             
             return finding
@@ -344,13 +446,14 @@ class WfuzzAdapter(ToolAdapterBase):
     def get_version(self) -> str:
         """Get Wfuzz version.
         
+        The result is cached for the adapter's lifetime, so only the first
+        call spawns a process.
+        
         Returns:
             Version string
         """
-        from galehuntui.core.exceptions import (
-            ToolNotFoundError,
-            ToolExecutionError,
-        )
+        if self._version is not None:
+            return self._version
         
         tool_path = self._get_tool_path()
         if not tool_path.exists():
@@ -363,21 +466,73 @@ class WfuzzAdapter(ToolAdapterBase):
                 text=True,
                 timeout=5,
             )
-            
-            # Wfuzz version output format: "Wfuzz 3.1.0"
-            output = result.stdout.strip()
-            if not output:
-                output = result.stderr.strip()
-            
-            if "wfuzz" in output.lower():
-                parts = output.split()
-                for i, part in enumerate(parts):
-                    if "wfuzz" in part.lower() and i + 1 < len(parts):
-                        return parts[i + 1]
-            
-            return output or "unknown"
-            
         except subprocess.TimeoutExpired:
             raise ToolExecutionError("Wfuzz version check timed out")
         except Exception as e:
             raise ToolExecutionError(f"Failed to get Wfuzz version: {e}")
+        
+        self._version = self._parse_version(result.stdout, result.stderr)
+        return self._version
+    
+    async def get_version_async(self) -> str:
+        """Get Wfuzz version without blocking the event loop.
+        
+        Shares the cache with get_version().
+        
+        Returns:
+            Version string
+            
+        Raises:
+            ToolNotFoundError: If Wfuzz is not installed
+            ToolExecutionError: If version check fails
+        """
+        if self._version is not None:
+            return self._version
+        
+        tool_path = self._get_tool_path()
+        if not tool_path.exists():
+            raise ToolNotFoundError(f"Wfuzz not found at {tool_path}")
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                str(tool_path), "--version",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=5,
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise ToolExecutionError("Wfuzz version check timed out")
+        except ToolExecutionError:
+            raise
+        except Exception as e:
+            raise ToolExecutionError(f"Failed to get Wfuzz version: {e}")
+        
+        self._version = self._parse_version(
+            stdout_bytes.decode("utf-8", errors="replace"),
+            stderr_bytes.decode("utf-8", errors="replace"),
+        )
+        return self._version
+    
+    @staticmethod
+    def _parse_version(stdout: str, stderr: str) -> str:
+        """Extract the version from `wfuzz --version` output.
+        
+        Args:
+            stdout: Standard output of the version command
+            stderr: Standard error, used when stdout is empty
+            
+        Returns:
+            Version string, or the raw output if no version is recognized
+        """
+        # Wfuzz version output format: "Wfuzz 3.1.0"
+        output = stdout.strip() or stderr.strip()
+        match = _VERSION_RE.search(output)
+        if match:
+            return match.group(1)
+        return output or "unknown"
@@ -5,6 +5,10 @@ must implement. It ensures consistent behavior across all tools and provides
 a standard contract for tool execution, output parsing, and management.
 """
 
+import asyncio
+import itertools
+import os
+import tempfile
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from pathlib import Path
@@ -12,6 +16,46 @@ from typing import Optional
 
 from galehuntui.core.models import Finding, ToolConfig, ToolResult
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is an optional speedup
+    import json as _json  # type: ignore[no-redef]
+
+
+# Per-process scratch directory for raw tool output, created on first use.
+# Prefer tmpfs so repeated runs don't hit the disk journal.
+_SHM_DIR = Path("/dev/shm")
+_output_dir: Optional[Path] = None
+_output_counter = itertools.count()
+
+# Write buffer for input files handed to tools
+_INPUT_FILE_BUFFER_SIZE = 1 << 20
+
+
+def _get_output_dir() -> Path:
+    """Get the per-process directory for raw tool output files.
+    
+    Returns:
+        Path to a private directory under /dev/shm (or the system temp dir)
+    """
+    global _output_dir
+    if _output_dir is None or not _output_dir.is_dir():
+        base = _SHM_DIR if _SHM_DIR.is_dir() else None
+        _output_dir = Path(tempfile.mkdtemp(prefix="galehuntui_", dir=base))
+    return _output_dir
+
+
+def _is_executable_file(path: Path) -> bool:
+    """Check whether path is a regular file the current user may execute.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if path is an executable regular file
+    """
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
 
 class ToolAdapter(ABC):
     """Abstract base class for all tool adapters.
@@ -179,6 +223,7 @@ class ToolAdapterBase(ToolAdapter):
         """
         self.bin_path = bin_path
         self._tool_binary = bin_path / self.name
+        self._available = False
     
     def _get_tool_path(self) -> Path:
         """Get path to tool binary.
@@ -191,21 +236,34 @@ class ToolAdapterBase(ToolAdapter):
     async def check_available(self) -> bool:
         """Check if tool is installed and accessible.
         
-        Default implementation checks if binary exists and is executable.
+        Default implementation checks that the binary is a regular file the
+        current user may execute. A positive result is cached for the
+        adapter's lifetime; a missing tool is re-checked on every call so
+        installing it mid-session is picked up.
         
         Returns:
             True if tool is available, False otherwise
         """
+        if self._available:
+            return True
+        
         tool_path = self._get_tool_path()
-        if not tool_path.exists():
-            return False
-        if not tool_path.is_file():
-            return False
-        # Check if executable (on Unix systems)
-        try:
-            return tool_path.stat().st_mode & 0o111 != 0
-        except (OSError, PermissionError):
-            return False
+        self._available = await asyncio.to_thread(_is_executable_file, tool_path)
+        return self._available
+    
+    def _new_output_path(self, suffix: str) -> Path:
+        """Get a fresh path for saving raw tool output.
+        
+        Paths live in a per-process scratch directory and are numbered
+        with a monotonic counter rather than random names.
+        
+        Args:
+            suffix: File extension including the dot (e.g., ".jsonl")
+            
+        Returns:
+            Path to a not-yet-created output file
+        """
+        return _get_output_dir() / f"{self.name}_{next(_output_counter)}{suffix}"
     
     def _create_input_file(self, inputs: list[str], output_dir: Path) -> Path:
         """Create temporary input file from inputs list.
@@ -221,7 +279,10 @@ class ToolAdapterBase(ToolAdapter):
             Path to created input file
         """
         input_file = output_dir / f"{self.name}_input.txt"
-        input_file.write_text("\n".join(inputs))
+        # Stream encoded lines through one buffered handle instead of
+        # materializing the whole joined text first
+        with input_file.open("wb", buffering=_INPUT_FILE_BUFFER_SIZE) as f:
+            f.writelines(f"{item}\n".encode() for item in inputs)
         return input_file
     
     def _parse_json_lines(self, raw: str) -> list[dict]:
@@ -235,15 +296,18 @@ class ToolAdapterBase(ToolAdapter):
         Returns:
             List of parsed JSON objects
         """
-        import json
+        results: list[dict] = []
+        append = results.append
+        loads = _json.loads
         
-        results = []
-        for line in raw.strip().split("\n"):
+        # No strip() copy of the whole output: empty lines are skipped here
+        # and whitespace-only lines fail to decode like any malformed line
+        for line in raw.split("\n"):
             if not line:
                 continue
             try:
-                results.append(json.loads(line))
-            except json.JSONDecodeError:
+                append(loads(line))
+            except ValueError:
                 # Skip malformed lines
                 continue
         return results
@@ -1,6 +1,9 @@
 """Dependency management for wordlists and templates."""
 
 import asyncio
+import functools
+import os
+from collections.abc import Awaitable, Callable, Iterator
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -10,6 +13,49 @@ import yaml
 
 from galehuntui.core.exceptions import DependencyError
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+# Upper bound on git clone/pull subprocesses running at once
+MAX_CONCURRENT_GIT_JOBS = 8
+
+# Directories inside dependency checkouts that never hold templates or
+# wordlists; hidden directories are always skipped as well
+SKIPPED_DIRS = frozenset({"node_modules", "__pycache__"})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_registry_cached(path: str, mtime_ns: int) -> dict:
+    # Keyed on mtime so edits to the registry file are picked up; the
+    # returned dict is shared between managers and must not be mutated
+    content = Path(path).read_text()
+    return yaml.load(content, Loader=_YamlLoader) or {}
+
+
+def _iter_files(
+    root: Path,
+    suffix: str,
+    skip: frozenset[str] = SKIPPED_DIRS,
+) -> Iterator[Path]:
+    # scandir entries carry the file type from readdir, so unlike rglob
+    # no extra stat is needed per entry. Hidden directories (.git, .github)
+    # and anything in skip are never descended into.
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip and not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
 
 class DependencyType(str, Enum):
     TEMPLATES = "templates"
@@ -24,7 +70,7 @@ class DependencyStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyInfo:
     id: str
     name: str
@@ -46,22 +92,27 @@ class DependencyManager:
         self.registry_path = registry_path or (
             Path(__file__).parent / "registry.yaml"
         )
-        self._registry: dict | None = None
+        self._git_semaphore = asyncio.Semaphore(MAX_CONCURRENT_GIT_JOBS)
     
     def _load_registry(self) -> dict:
-        if self._registry is None:
-            if not self.registry_path.exists():
-                raise DependencyError(f"Registry not found: {self.registry_path}")
-            content = self.registry_path.read_text()
-            self._registry = yaml.safe_load(content) or {}
-        return self._registry
+        try:
+            mtime_ns = self.registry_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise DependencyError(f"Registry not found: {self.registry_path}")
+        return _load_registry_cached(str(self.registry_path), mtime_ns)
     
     async def get_dependencies(self) -> list[DependencyInfo]:
+        # Registry parsing and the directory scans are blocking file I/O;
+        # keep them off the event loop so the TUI stays responsive
+        return await asyncio.to_thread(self.get_dependencies_sync)
+    
+    def get_dependencies_sync(self) -> list[DependencyInfo]:
         registry = self._load_registry()
+        installed = self._scan_installed()
         deps = []
         
         for dep_id, config in registry.get("dependencies", {}).items():
-            status = await self._check_status(dep_id, config)
+            status = self._check_status(dep_id, config, installed)
             install_path = self._get_install_path(dep_id, config)
             
             deps.append(DependencyInfo(
@@ -70,7 +121,7 @@ class DependencyManager:
                 type=DependencyType(config["type"]),
                 description=config.get("description", ""),
                 status=status,
-                installed_path=install_path if install_path.exists() else None,
+                installed_path=install_path if status == DependencyStatus.INSTALLED else None,
                 size_estimate=config.get("size_estimate"),
                 required=config.get("required", False),
             ))
@@ -82,10 +133,31 @@ class DependencyManager:
         base_dir = self.templates_dir if dep_type == DependencyType.TEMPLATES else self.wordlists_dir
         return base_dir / dep_id
     
-    async def _check_status(self, dep_id: str, config: dict) -> DependencyStatus:
+    def _scan_installed(self) -> set[Path]:
+        # One directory read per dependency type instead of a stat per dependency
+        installed: set[Path] = set()
+        for base_dir in (self.templates_dir, self.wordlists_dir):
+            try:
+                with os.scandir(base_dir) as entries:
+                    installed.update(base_dir / entry.name for entry in entries)
+            except OSError:
+                continue
+        return installed
+    
+    def _check_status(
+        self,
+        dep_id: str,
+        config: dict,
+        installed: Optional[set[Path]] = None,
+    ) -> DependencyStatus:
         install_path = self._get_install_path(dep_id, config)
         
-        if not install_path.exists():
+        if installed is not None:
+            exists = install_path in installed
+        else:
+            exists = install_path.exists()
+        
+        if not exists:
             return DependencyStatus.NOT_INSTALLED
         
         return DependencyStatus.INSTALLED
@@ -124,39 +196,40 @@ class DependencyManager:
             return await self.install(dep_id)
         
         if config["source"] == "git":
-            return await self._git_pull(install_path)
+            return await self._git_pull(
+                install_path,
+                branch=config.get("branch", "master"),
+            )
         
         return False
     
     async def update_all(self, *, skip_errors: bool = False) -> dict[str, bool | Exception]:
-        results: dict[str, bool | Exception] = {}
         deps = await self.get_dependencies()
-        
-        for dep in deps:
-            if dep.status == DependencyStatus.NOT_INSTALLED:
-                continue
-            try:
-                results[dep.id] = await self.update(dep.id)
-            except Exception as e:
-                if skip_errors:
-                    results[dep.id] = e
-                else:
-                    raise
-        
-        return results
+        dep_ids = [dep.id for dep in deps if dep.status != DependencyStatus.NOT_INSTALLED]
+        return await self._run_concurrently(self.update, dep_ids, skip_errors)
     
     async def install_all(self, *, skip_errors: bool = False) -> dict[str, bool | Exception]:
-        results: dict[str, bool | Exception] = {}
         deps = await self.get_dependencies()
+        dep_ids = [dep.id for dep in deps]
+        return await self._run_concurrently(self.install, dep_ids, skip_errors)
+    
+    async def _run_concurrently(
+        self,
+        action: Callable[[str], Awaitable[bool]],
+        dep_ids: list[str],
+        skip_errors: bool,
+    ) -> dict[str, bool | Exception]:
+        outcomes = await asyncio.gather(
+            *(action(dep_id) for dep_id in dep_ids),
+            return_exceptions=True,
+        )
         
-        for dep in deps:
-            try:
-                results[dep.id] = await self.install(dep.id)
-            except Exception as e:
-                if skip_errors:
-                    results[dep.id] = e
-                else:
-                    raise
+        results: dict[str, bool | Exception] = {}
+        for dep_id, outcome in zip(dep_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                if not skip_errors or not isinstance(outcome, Exception):
+                    raise outcome
+            results[dep_id] = outcome
         
         return results
     
@@ -168,7 +241,7 @@ class DependencyManager:
             return False
         
         install_path = self._get_install_path(dep_id, config)
-        return install_path.exists() and install_path.is_dir()
+        return await asyncio.to_thread(install_path.is_dir)
     
     async def uninstall(self, dep_id: str) -> bool:
         registry = self._load_registry()
@@ -183,34 +256,40 @@ class DependencyManager:
             return True
         
         import shutil
-        shutil.rmtree(install_path)
+        await asyncio.to_thread(shutil.rmtree, install_path)
         return True
     
     async def _git_clone(self, url: str, dest: Path, branch: str = "master") -> bool:
         if dest.exists():
             return True
         
-        process = await asyncio.create_subprocess_exec(
-            "git", "clone", "--depth=1", "--branch", branch, url, str(dest),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        await self._run_git(
+            "clone", "--depth=1", "--single-branch", "--branch", branch, url, str(dest),
+            error_prefix="Git clone failed",
         )
-        _, stderr = await process.communicate()
-        
-        if process.returncode != 0:
-            raise DependencyError(f"Git clone failed: {stderr.decode()}")
-        
         return True
     
-    async def _git_pull(self, repo_path: Path) -> bool:
-        process = await asyncio.create_subprocess_exec(
-            "git", "-C", str(repo_path), "pull", "--ff-only",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+    async def _git_pull(self, repo_path: Path, branch: str = "master") -> bool:
+        # Fetch only the new tip and move to it; a plain pull on a shallow
+        # clone walks and downloads the intermediate history as well
+        await self._run_git(
+            "-C", str(repo_path), "fetch", "--depth=1", "origin", branch,
+            error_prefix="Git pull failed",
         )
-        _, stderr = await process.communicate()
+        await self._run_git(
+            "-C", str(repo_path), "reset", "--hard", "FETCH_HEAD",
+            error_prefix="Git pull failed",
+        )
+        return True
+    
+    async def _run_git(self, *args: str, error_prefix: str) -> None:
+        async with self._git_semaphore:
+            process = await asyncio.create_subprocess_exec(
+                "git", *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
         
         if process.returncode != 0:
-            raise DependencyError(f"Git pull failed: {stderr.decode()}")
-        
-        return True
+            raise DependencyError(f"{error_prefix}: {stderr.decode()}")
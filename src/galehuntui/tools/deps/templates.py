@@ -1,9 +1,75 @@
 """Nuclei template management utilities."""
 
+import fnmatch
+import json
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from galehuntui.tools.deps.manager import DependencyManager
+from galehuntui.tools.deps.manager import DependencyManager, _iter_files
+
+
+# Below this size a plain read is cheaper than setting up a mapping
+_MMAP_MIN_SIZE = 4096
+
+# Content scans are bound on read syscalls, which release the GIL
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Line-based lookups for the two info fields the index needs, so
+# templates are never decoded or parsed as YAML
+_SEVERITY_RE = re.compile(rb"^[ \t]*severity:[ \t]*['\"]?([A-Za-z]+)", re.MULTILINE)
+_TAGS_RE = re.compile(rb"^[ \t]*tags:[ \t]*(.*)$", re.MULTILINE)
+# Block-list form: "tags:" alone on its line, then one "- tag" per line
+_TAG_ITEMS_RE = re.compile(rb"(?:\r?\n[ \t]*-[ \t]*[^\r\n]*)+")
+
+
+def _tree_stamp(base: Path) -> Optional[tuple[int, int]]:
+    # Updates go through git, which rewrites .git/index, so its mtime
+    # catches changes deep in the tree that the root mtime misses
+    try:
+        root_mtime = base.stat().st_mtime_ns
+    except OSError:
+        return None
+    try:
+        index_mtime = (base / ".git" / "index").stat().st_mtime_ns
+    except OSError:
+        index_mtime = 0
+    return (root_mtime, index_mtime)
+
+
+def _parse_info(data: bytes | mmap.mmap) -> tuple[str, list[str]]:
+    match = _SEVERITY_RE.search(data)
+    severity = match.group(1).decode("ascii").lower() if match else ""
+    
+    tags = []
+    match = _TAGS_RE.search(data)
+    if match:
+        raw = match.group(1).strip()
+        if not raw or raw.startswith(b"#"):
+            items = _TAG_ITEMS_RE.match(data, match.end())
+            raw = b",".join(
+                line.strip()[1:] for line in items.group(0).splitlines()[1:]
+            ) if items else b""
+        raw = raw.decode("utf-8", "replace").strip().strip("[]")
+        for tag in raw.split(","):
+            tag = tag.strip().strip("'\"").lower()
+            if tag:
+                tags.append(tag)
+    return severity, tags
+
+
+def _scan_template(path: Path) -> Optional[tuple[str, list[str]]]:
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                return _parse_info(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _parse_info(mm)
+    except (OSError, ValueError):
+        return None
 
 
 class TemplateManager:
@@ -29,9 +95,19 @@ class TemplateManager:
         "cloud",
     ]
     
+    INDEX_FILENAME = ".galehunt_index.json"
+    
     def __init__(self, deps_manager: DependencyManager):
         self.deps_manager = deps_manager
         self.templates_dir = deps_manager.templates_dir
+        self._yaml_cache: Optional[list[Path]] = None
+        self._yaml_cache_mtime: Optional[tuple[int, int]] = None
+        self._index_cache: Optional[dict[str, Any]] = None
+        self._index_mtime: Optional[tuple[int, int]] = None
+    
+    @property
+    def index_path(self) -> Path:
+        return self.templates_dir / self.INDEX_FILENAME
     
     def get_template_path(self) -> Optional[Path]:
         path = self.templates_dir / "nuclei-templates"
@@ -66,45 +142,111 @@ class TemplateManager:
         if base is None:
             return []
         
-        results = []
-        severity_lower = severity.lower()
-        
-        for template_file in base.rglob("*.yaml"):
-            try:
-                content = template_file.read_text()
-                if f"severity: {severity_lower}" in content:
-                    results.append(template_file)
-            except (OSError, UnicodeDecodeError):
-                continue
-        
-        return results
+        index = self._index(base)
+        return [base / rel for rel in index["by_severity"].get(severity.lower(), [])]
     
     def get_templates_by_tag(self, tag: str) -> list[Path]:
         base = self.get_template_path()
         if base is None:
             return []
         
-        results = []
-        tag_lower = tag.lower()
-        
-        for template_file in base.rglob("*.yaml"):
-            try:
-                content = template_file.read_text()
-                if tag_lower in content.lower():
-                    results.append(template_file)
-            except (OSError, UnicodeDecodeError):
-                continue
-        
-        return results
+        index = self._index(base)
+        return [base / rel for rel in index["by_tag"].get(tag.lower(), [])]
     
     def count_templates(self) -> int:
         base = self.get_template_path()
         if base is None:
             return 0
-        return len(list(base.rglob("*.yaml")))
+        return len(self._all_yaml(base))
     
     def search(self, pattern: str) -> list[Path]:
         base = self.get_template_path()
         if base is None:
             return []
-        return sorted(base.rglob(f"*{pattern}*.yaml"))
+        name_pattern = f"*{pattern}*.yaml"
+        return sorted(
+            path for path in self._all_yaml(base)
+            if fnmatch.fnmatchcase(path.name, name_pattern)
+        )
+    
+    def build_index(self) -> dict[str, Any]:
+        base = self.get_template_path_or_raise()
+        stamp = _tree_stamp(base)
+        paths = self._all_yaml(base)
+        
+        all_yaml = []
+        by_severity: dict[str, list[str]] = {}
+        by_tag: dict[str, list[str]] = {}
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+            for path, info in zip(paths, pool.map(_scan_template, paths)):
+                rel = path.relative_to(base).as_posix()
+                all_yaml.append(rel)
+                if info is None:
+                    continue
+                severity, tags = info
+                if severity:
+                    by_severity.setdefault(severity, []).append(rel)
+                for tag in tags:
+                    by_tag.setdefault(tag, []).append(rel)
+        
+        index = {
+            "mtime": list(stamp) if stamp else None,
+            "all_yaml": all_yaml,
+            "by_severity": by_severity,
+            "by_tag": by_tag,
+        }
+        self._write_index(index)
+        self._index_cache = index
+        self._index_mtime = stamp
+        return index
+    
+    def _index(self, base: Path) -> dict[str, Any]:
+        stamp = _tree_stamp(base)
+        if stamp is None:
+            return {"mtime": None, "all_yaml": [], "by_severity": {}, "by_tag": {}}
+        if self._index_cache is not None and self._index_mtime == stamp:
+            return self._index_cache
+        
+        index = self._read_index()
+        if index is None or index.get("mtime") != list(stamp):
+            return self.build_index()
+        
+        self._index_cache = index
+        self._index_mtime = stamp
+        if self._yaml_cache_mtime != stamp:
+            self._yaml_cache = [base / rel for rel in index["all_yaml"]]
+            self._yaml_cache_mtime = stamp
+        return index
+    
+    def _read_index(self) -> Optional[dict[str, Any]]:
+        try:
+            index = json.loads(self.index_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict):
+            return None
+        if not all(key in index for key in ("all_yaml", "by_severity", "by_tag")):
+            return None
+        return index
+    
+    def _write_index(self, index: dict[str, Any]) -> None:
+        # Write-then-rename so a concurrent reader never sees a partial file;
+        # an unwritable templates dir just means no persistence
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(index))
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+    
+    def _all_yaml(self, base: Path) -> list[Path]:
+        # One walk shared by every query; rebuilt when the checkout changes
+        stamp = _tree_stamp(base)
+        if stamp is None:
+            return []
+        
+        if self._yaml_cache is None or self._yaml_cache_mtime != stamp:
+            self._yaml_cache = list(_iter_files(base, ".yaml"))
+            self._yaml_cache_mtime = stamp
+        return self._yaml_cache
+
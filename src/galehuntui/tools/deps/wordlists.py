@@ -1,9 +1,10 @@
 """Wordlist management utilities."""
 
+import fnmatch
 from pathlib import Path
 from typing import Optional
 
-from galehuntui.tools.deps.manager import DependencyManager
+from galehuntui.tools.deps.manager import DependencyManager, _iter_files
 
 
 class WordlistManager:
@@ -43,7 +44,7 @@ class WordlistManager:
     def list_available(self) -> list[Path]:
         if not self.wordlists_dir.exists():
             return []
-        return sorted(self.wordlists_dir.rglob("*.txt"))
+        return sorted(_iter_files(self.wordlists_dir, ".txt"))
     
     def list_shortcuts(self) -> dict[str, Path | None]:
         return {
@@ -54,4 +55,8 @@ class WordlistManager:
     def search(self, pattern: str) -> list[Path]:
         if not self.wordlists_dir.exists():
             return []
-        return sorted(self.wordlists_dir.rglob(f"*{pattern}*"))
+        name_pattern = f"*{pattern}*"
+        return sorted(
+            path for path in _iter_files(self.wordlists_dir, "")
+            if fnmatch.fnmatchcase(path.name, name_pattern)
+        )
@@ -1,19 +1,106 @@
 """Tool installation and management."""
 
 import asyncio
+import functools
 import hashlib
 import platform
 import shutil
-import tarfile
-import zipfile
-from pathlib import Path
-from typing import Any, Optional
+import time
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Optional, TypeVar
 
-import httpx
 import yaml
 
 from galehuntui.core.exceptions import ToolInstallError
 
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is an optional speedup
+    import json
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+# Upper bound on tool installs running at once; keeps GitHub API and
+# download traffic within reasonable limits
+MAX_CONCURRENT_INSTALLS = 8
+
+# Connection pool for the shared HTTP client; sized so concurrent
+# installs each get a connection
+HTTP_MAX_CONNECTIONS = 2 * MAX_CONCURRENT_INSTALLS
+HTTP_MAX_KEEPALIVE_CONNECTIONS = MAX_CONCURRENT_INSTALLS
+
+# Downloaded data is hashed and written in batches of this size on a
+# worker thread, so disk writes never block the event loop
+DOWNLOAD_WRITE_BATCH_SIZE = 1 << 20
+
+# Copy buffer when streaming a binary out of a release archive
+ARCHIVE_COPY_BUFFER_SIZE = 1 << 20
+
+# Seconds a verify_tool result is reused; screens re-check every tool on
+# each visit, and installs through this installer invalidate it early
+VERIFY_CACHE_TTL = 30.0
+
+# Release assets that sit next to the real archive and are never installable
+_SIGNATURE_EXTENSIONS = (".sha256", ".md5", ".sig", ".asc")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_registry_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    # Keyed on mtime so edits to the registry file are picked up; the
+    # returned dict is shared between installers and must not be mutated
+    content = Path(path).read_text()
+    return yaml.load(content, Loader=_YamlLoader)
+
+
+def _write_batch(f: BinaryIO, hasher: Optional[Any], chunks: list[bytes]) -> None:
+    if hasher is not None:
+        for chunk in chunks:
+            hasher.update(chunk)
+    f.writelines(chunks)
+
+
+_Member = TypeVar("_Member")
+
+
+def _select_binary(
+    members: Iterable[tuple[str, _Member]],
+    binary_name: str,
+    platform_str: str,
+    arch: str,
+) -> Optional[_Member]:
+    # Exact name wins, then a name carrying platform and arch, then the
+    # first other file that starts with the binary name and isn't a doc
+    fallback = None
+    for name, member in members:
+        if not name.startswith(binary_name):
+            continue
+        if name == binary_name:
+            return member
+        if platform_str in name and arch in name:
+            return member
+        if fallback is None and not name.endswith(('.txt', '.md', '.json', '.yaml')):
+            fallback = member
+    return fallback
+
 
 class ToolInstaller:
     """Manages tool installation, updates, and verification."""
@@ -31,10 +118,42 @@ class ToolInstaller:
         self.registry_path = Path(__file__).parent / "registry.yaml"
         self.versions_path = tools_dir / "versions.json"
         self.checksums_path = tools_dir / "checksums.json"
+        self._client: Optional["httpx.AsyncClient"] = None
+        # tool name -> (monotonic time checked, result)
+        self._verify_cache: dict[str, tuple[float, bool]] = {}
         
         self.bin_dir.mkdir(parents=True, exist_ok=True)
         self.scripts_dir.mkdir(parents=True, exist_ok=True)
     
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Get the pooled HTTP client, creating it on first use.
+        
+        API calls and downloads share one client so keep-alive connections
+        are reused instead of paying a TCP/TLS handshake per request.
+        httpx is imported here rather than at module load, since most
+        sessions never install anything.
+        
+        Returns:
+            Shared AsyncClient instance
+        """
+        import httpx
+        
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     @staticmethod
     def get_platform() -> str:
         """Detect current platform.
@@ -68,6 +187,8 @@ class ToolInstaller:
     def load_registry(self) -> dict[str, Any]:
         """Load tool registry from YAML.
         
+        The parsed registry is cached until the file's mtime changes.
+        
         Returns:
             Registry data dictionary
             
@@ -78,8 +199,8 @@ class ToolInstaller:
             raise ToolInstallError(f"Registry not found: {self.registry_path}")
         
         try:
-            content = self.registry_path.read_text()
-            return yaml.safe_load(content)
+            mtime_ns = self.registry_path.stat().st_mtime_ns
+            return _load_registry_cached(str(self.registry_path), mtime_ns)
         except Exception as e:
             raise ToolInstallError(f"Failed to load registry: {e}") from e
     
@@ -101,16 +222,18 @@ class ToolInstaller:
         Raises:
             ToolInstallError: If API request fails
         """
+        import httpx
+        
         url = f"https://api.github.com/repos/{repo}/releases/latest"
         
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(
-                    url,
-                    headers={"Accept": "application/vnd.github+json"},
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().get(
+                url,
+                headers={"Accept": "application/vnd.github+json"},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as e:
             raise ToolInstallError(
                 f"GitHub API error for {repo}: {e.response.status_code}"
@@ -138,14 +261,16 @@ class ToolInstaller:
         Returns:
             Matching asset dict or None
         """
-        search_terms = [platform_str, arch] + patterns
+        search_terms = tuple(
+            term.lower() for term in (platform_str, arch, *patterns)
+        )
         
         for asset in assets:
             name = asset["name"].lower()
             
-            if all(term.lower() in name for term in search_terms):
-                if any(ext in name for ext in [".sha256", ".md5", ".sig", ".asc"]):
-                    continue
+            if name.endswith(_SIGNATURE_EXTENSIONS):
+                continue
+            if all(term in name for term in search_terms):
                 return asset
         
         return None
@@ -156,34 +281,60 @@ class ToolInstaller:
         dest: Path,
         *,
         timeout: int = 300,
+        expected_checksum: Optional[str] = None,
+        algorithm: str = "sha256",
     ) -> Path:
         """Download file from URL.
         
+        When a checksum is given the file is hashed as it streams in, so
+        it never has to be read back from disk for verification.
+        
         Args:
             url: Download URL
             dest: Destination file path
             timeout: Download timeout in seconds
+            expected_checksum: Expected checksum (hex string), if known
+            algorithm: Hash algorithm for expected_checksum
             
         Returns:
             Path to downloaded file
             
         Raises:
-            ToolInstallError: If download fails
+            ToolInstallError: If download fails or checksum does not match
         """
+        hasher = hashlib.new(algorithm) if expected_checksum else None
+        
         try:
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                async with client.stream("GET", url) as response:
-                    response.raise_for_status()
-                    
-                    with dest.open("wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=8192):
-                            f.write(chunk)
-            
-            return dest
+            client = self._get_client()
+            async with client.stream("GET", url, timeout=timeout) as response:
+                response.raise_for_status()
+                
+                with dest.open("wb") as f:
+                    batch: list[bytes] = []
+                    batch_size = 0
+                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                        batch.append(chunk)
+                        batch_size += len(chunk)
+                        if batch_size >= DOWNLOAD_WRITE_BATCH_SIZE:
+                            await asyncio.to_thread(_write_batch, f, hasher, batch)
+                            batch = []
+                            batch_size = 0
+                    if batch:
+                        await asyncio.to_thread(_write_batch, f, hasher, batch)
         except Exception as e:
             if dest.exists():
                 dest.unlink()
             raise ToolInstallError(f"Download failed: {e}") from e
+        
+        if (
+            expected_checksum is not None
+            and hasher is not None
+            and hasher.hexdigest().lower() != expected_checksum.lower()
+        ):
+            dest.unlink()
+            raise ToolInstallError(f"Checksum verification failed for {dest.name}")
+        
+        return dest
     
     def verify_checksum(
         self,
@@ -201,16 +352,13 @@ class ToolInstaller:
         Returns:
             True if checksum matches
         """
-        if algorithm == "sha256":
-            hasher = hashlib.sha256()
-        elif algorithm == "md5":
-            hasher = hashlib.md5()
-        else:
+        if algorithm not in ("sha256", "md5"):
             return False
         
-        with file_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
+        # file_digest runs the read/update loop in C with a large buffer;
+        # an unbuffered handle lets it read straight into that buffer
+        with file_path.open("rb", buffering=0) as f:
+            hasher = hashlib.file_digest(f, algorithm)
         
         return hasher.hexdigest().lower() == expected.lower()
     
@@ -227,6 +375,9 @@ class ToolInstaller:
         Raises:
             ToolInstallError: If extraction fails
         """
+        import tarfile
+        import zipfile
+        
         try:
             if archive_path.suffix == ".zip" or archive_path.name.endswith(".zip"):
                 with zipfile.ZipFile(archive_path, "r") as zf:
@@ -244,6 +395,84 @@ class ToolInstaller:
         except Exception as e:
             raise ToolInstallError(f"Archive extraction failed: {e}") from e
     
+    def extract_binary(
+        self,
+        archive_path: Path,
+        binary_name: str,
+        dest: Path,
+        *,
+        platform_str: str,
+        arch: str,
+    ) -> Path:
+        """Extract only the tool binary from a release archive.
+        
+        Release archives also carry READMEs, licenses and completions that
+        would be thrown away, so the binary member is picked from the
+        archive listing and streamed straight to its destination.
+        
+        Args:
+            archive_path: Path to archive file (zip, tar.gz, tgz or tar)
+            binary_name: Name of the binary to extract
+            dest: Destination path for the binary
+            platform_str: Target platform (linux, darwin, windows)
+            arch: Target architecture (amd64, arm64, etc.)
+            
+        Returns:
+            Path to the extracted binary
+            
+        Raises:
+            ToolInstallError: If the archive cannot be read or has no binary
+        """
+        import tarfile
+        import zipfile
+        
+        name = archive_path.name
+        try:
+            if name.endswith(".zip"):
+                with zipfile.ZipFile(archive_path, "r") as zf:
+                    info = _select_binary(
+                        ((PurePosixPath(i.filename).name, i) for i in zf.infolist() if not i.is_dir()),
+                        binary_name,
+                        platform_str,
+                        arch,
+                    )
+                    if info is None:
+                        raise ToolInstallError(
+                            f"Binary '{binary_name}' not found in archive"
+                        )
+                    with zf.open(info) as src, dest.open("wb") as dst:
+                        shutil.copyfileobj(src, dst, ARCHIVE_COPY_BUFFER_SIZE)
+            elif name.endswith((".tar.gz", ".tgz", ".tar")):
+                # "r:*" detects the compression, so plain and gzipped tars share a path
+                with tarfile.open(archive_path, "r:*") as tf:
+                    member = _select_binary(
+                        ((PurePosixPath(m.name).name, m) for m in tf.getmembers() if m.isfile()),
+                        binary_name,
+                        platform_str,
+                        arch,
+                    )
+                    if member is None:
+                        raise ToolInstallError(
+                            f"Binary '{binary_name}' not found in archive"
+                        )
+                    member_file = tf.extractfile(member)
+                    if member_file is None:
+                        raise ToolInstallError(
+                            f"Binary '{binary_name}' not found in archive"
+                        )
+                    with member_file, dest.open("wb") as dst:
+                        shutil.copyfileobj(member_file, dst, ARCHIVE_COPY_BUFFER_SIZE)
+            else:
+                raise ToolInstallError(f"Unsupported archive format: {archive_path.suffix}")
+            
+            return dest
+        except ToolInstallError:
+            raise
+        except Exception as e:
+            if dest.exists():
+                dest.unlink()
+            raise ToolInstallError(f"Archive extraction failed: {e}") from e
+    
     async def install_from_github_release(
         self,
         tool_name: str,
@@ -288,45 +517,22 @@ class ToolInstaller:
         temp_dir.mkdir(exist_ok=True)
         
         archive_path = temp_dir / asset["name"]
-        await self.download_file(download_url, archive_path)
-        
-        if checksum:
-            if not self.verify_checksum(archive_path, checksum):
-                archive_path.unlink()
-                raise ToolInstallError(f"Checksum verification failed for {tool_name}")
+        await self.download_file(
+            download_url,
+            archive_path,
+            expected_checksum=checksum,
+        )
         
         binary_path = self.bin_dir / binary_name
         
         if archive_path.name.endswith((".zip", ".tar.gz", ".tgz", ".tar")):
-            extract_dir = temp_dir / f"{tool_name}_extract"
-            extract_dir.mkdir(exist_ok=True)
-            self.extract_archive(archive_path, extract_dir)
-            
-            found_binary = None
-            platform_str = self.get_platform()
-            arch = self.get_arch()
-            
-            for candidate in extract_dir.rglob("*"):
-                if not candidate.is_file():
-                    continue
-                cname = candidate.name
-                if cname == binary_name:
-                    found_binary = candidate
-                    break
-                if cname.startswith(binary_name) and platform_str in cname and arch in cname:
-                    found_binary = candidate
-                    break
-                if cname.startswith(binary_name) and not cname.endswith(('.txt', '.md', '.json', '.yaml')):
-                    if found_binary is None:
-                        found_binary = candidate
-            
-            if found_binary is None:
-                raise ToolInstallError(
-                    f"Binary '{binary_name}' not found in extracted archive"
-                )
-            
-            shutil.move(str(found_binary), str(binary_path))
-            shutil.rmtree(extract_dir)
+            self.extract_binary(
+                archive_path,
+                binary_name,
+                binary_path,
+                platform_str=platform_str,
+                arch=arch,
+            )
         else:
             shutil.move(str(archive_path), str(binary_path))
         
@@ -408,24 +614,28 @@ class ToolInstaller:
         tool_config = registry["tools"][tool_name]
         install_method = tool_config["install_method"]
         
-        if install_method == "github_release":
-            return await self.install_from_github_release(
-                tool_name=tool_name,
-                repo=tool_config["repo"],
-                binary_name=tool_config.get("binary_name", tool_name),
-                asset_patterns=tool_config.get("asset_patterns", []),
-                checksum=tool_config.get("checksum"),
-            )
-        elif install_method == "git":
-            return await self.install_from_git(
-                tool_name=tool_name,
-                repo_url=tool_config["repo_url"],
-                branch=tool_config.get("branch", "master"),
-            )
-        else:
-            raise ToolInstallError(
-                f"Unsupported install method: {install_method}"
-            )
+        try:
+            if install_method == "github_release":
+                return await self.install_from_github_release(
+                    tool_name=tool_name,
+                    repo=tool_config["repo"],
+                    binary_name=tool_config.get("binary_name", tool_name),
+                    asset_patterns=tool_config.get("asset_patterns", []),
+                    checksum=tool_config.get("checksum"),
+                )
+            elif install_method == "git":
+                return await self.install_from_git(
+                    tool_name=tool_name,
+                    repo_url=tool_config["repo_url"],
+                    branch=tool_config.get("branch", "master"),
+                )
+            else:
+                raise ToolInstallError(
+                    f"Unsupported install method: {install_method}"
+                )
+        finally:
+            # Whatever happened on disk, the cached answer is now stale
+            self._verify_cache.pop(tool_name, None)
     
     async def install_all(self, *, skip_errors: bool = False) -> dict[str, Path | Exception]:
         """Install all tools from registry.
@@ -437,29 +647,50 @@ class ToolInstaller:
             Dict mapping tool names to installed paths or exceptions
         """
         registry = self.load_registry()
-        results: dict[str, Path | Exception] = {}
+        tool_names = list(registry["tools"])
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_INSTALLS)
         
-        for tool_name in registry["tools"]:
-            try:
-                path = await self.install_tool(tool_name)
-                results[tool_name] = path
-            except Exception as e:
-                if skip_errors:
-                    results[tool_name] = e
-                else:
-                    raise
+        async def install_one(tool_name: str) -> Path:
+            async with semaphore:
+                return await self.install_tool(tool_name)
+        
+        outcomes = await asyncio.gather(
+            *(install_one(tool_name) for tool_name in tool_names),
+            return_exceptions=True,
+        )
+        
+        results: dict[str, Path | Exception] = {}
+        for tool_name, outcome in zip(tool_names, outcomes):
+            if isinstance(outcome, BaseException):
+                if not skip_errors or not isinstance(outcome, Exception):
+                    raise outcome
+            results[tool_name] = outcome
         
         return results
     
-    def verify_tool(self, tool_name: str) -> bool:
+    def verify_tool(self, tool_name: str, *, refresh: bool = False) -> bool:
         """Verify tool is installed and executable.
         
+        Results are reused for VERIFY_CACHE_TTL seconds, since a miss
+        walks every PATH entry.
+        
         Args:
             tool_name: Tool identifier
+            refresh: Ignore any cached result and check again
             
         Returns:
             True if tool is available
         """
+        now = time.monotonic()
+        cached = self._verify_cache.get(tool_name)
+        if not refresh and cached is not None and now - cached[0] < VERIFY_CACHE_TTL:
+            return cached[1]
+        
+        result = self._check_tool(tool_name)
+        self._verify_cache[tool_name] = (now, result)
+        return result
+    
+    def _check_tool(self, tool_name: str) -> bool:
         binary_path = self.bin_dir / tool_name
         script_path = self.scripts_dir / tool_name
         
@@ -475,7 +706,19 @@ class ToolInstaller:
         return False
     
     async def get_tool_version(self, tool_name: str) -> Optional[str]:
-        """Get installed tool version."""
+        """Get installed tool version.
+        
+        Runs the binary once with the registry's ``version_flag`` (or
+        ``--version`` for tools without one). Parsed versions are cached
+        in versions.json until the binary or the flag changes.
+        
+        Args:
+            tool_name: Tool identifier
+            
+        Returns:
+            Version string, "Installed" if it cannot be determined, or
+            None if the tool is not installed
+        """
         binary_path = self.bin_dir / tool_name
         script_path = self.scripts_dir / tool_name
         
@@ -486,27 +729,82 @@ class ToolInstaller:
             return "Installed"
         
         try:
-            for flag in ["-version", "--version", "-V", "version"]:
-                process = await asyncio.create_subprocess_exec(
-                    str(binary_path),
-                    flag,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=5.0,
-                )
-                
-                output = (stdout + stderr).decode()
-                version = self._extract_version(output)
-                if version:
-                    return version
+            tool_config = self.load_registry()["tools"].get(tool_name) or {}
+        except (ToolInstallError, KeyError, TypeError):
+            tool_config = {}
+        flag = tool_config.get("version_flag", "--version")
+        
+        try:
+            mtime_ns = binary_path.stat().st_mtime_ns
+        except OSError:
+            return "Installed"
+        
+        versions = self._load_versions()
+        cached = versions.get(tool_name)
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == mtime_ns
+            and cached.get("flag") == flag
+        ):
+            return cached.get("version", "Installed")
+        
+        version = await self._probe_version(binary_path, flag)
+        if version is None:
+            # A timeout or unparseable output may be transient, so only
+            # real versions are cached and failed probes retry next time
+            return "Installed"
+        versions[tool_name] = {"version": version, "flag": flag, "mtime_ns": mtime_ns}
+        self._save_versions(versions)
+        return version
+    
+    async def _probe_version(self, binary_path: Path, flag: str) -> Optional[str]:
+        """Run a binary with its version flag and parse the output."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                str(binary_path),
+                flag,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
         except Exception:
-            pass
+            return None
         
-        return "Installed"
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(),
+                timeout=5.0,
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return None
+        
+        return self._extract_version((stdout + stderr).decode(errors="replace"))
+    
+    def _load_versions(self) -> dict[str, Any]:
+        """Load cached tool versions, or an empty dict if unavailable."""
+        return self._read_state(self.versions_path)
+    
+    def _save_versions(self, versions: dict[str, Any]) -> None:
+        """Persist cached tool versions; failures only cost a re-probe."""
+        self._write_state(self.versions_path, versions)
+    
+    @staticmethod
+    def _read_state(path: Path) -> dict[str, Any]:
+        """Read a JSON state file from tools_dir (orjson when available)."""
+        try:
+            data = _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+    
+    @staticmethod
+    def _write_state(path: Path, data: dict[str, Any]) -> None:
+        """Write a JSON state file to tools_dir; errors are ignored."""
+        try:
+            path.write_bytes(_json_dumps(data))
+        except (OSError, TypeError):
+            pass
     
     def _extract_version(self, output: str) -> Optional[str]:
         """Extract version string from tool output."""
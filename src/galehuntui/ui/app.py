@@ -1,5 +1,9 @@
+import asyncio
+import importlib
+import os
+import sys
 from pathlib import Path
-from typing import Any, Optional, Type
+from typing import Any, Callable, Optional, Type
 
 import yaml
 
@@ -8,21 +12,52 @@ from textual.driver import Driver
 from textual.screen import Screen
 
 from galehuntui.ui.screens.home import HomeScreen
-from galehuntui.ui.screens.new_run import NewRunScreen
-from galehuntui.ui.screens.run_detail import RunDetailScreen
-from galehuntui.ui.screens.tools_manager import ToolsManagerScreen
-from galehuntui.ui.screens.deps_manager import DepsManagerScreen
-from galehuntui.ui.screens.settings import SettingsScreen
-from galehuntui.ui.screens.profiles import ProfilesScreen
-from galehuntui.ui.screens.scope import ScopeScreen
-from galehuntui.ui.screens.finding_detail import FindingDetailScreen
-from galehuntui.ui.screens.help import HelpScreen
-from galehuntui.ui.screens.setup import SetupWizardScreen
 
 from galehuntui.core.config import get_data_dir, get_user_config_path
 from galehuntui.storage.database import Database
 from galehuntui.ui.themes import GALEHUNT_THEMES
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# One-line sidecar next to config.yaml so startup can skip parsing YAML
+THEME_CACHE_FILENAME = ".theme_cache"
+
+
+def _use_uvloop() -> None:
+    """Run the app on uvloop when the optional dependency is installed."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:  # uvloop is an optional speedup
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _lazy_screen(target: str) -> Callable[[], Screen]:
+    """Build a screen factory that imports its module on first use.
+    
+    Only the home screen is needed at startup; the rest are imported the
+    first time they are pushed, which keeps their dependencies (tool
+    adapters, installer, storage) off the startup path.
+    
+    Args:
+        target: "module.path:ClassName" of the screen
+        
+    Returns:
+        Callable returning a new screen instance
+    """
+    module_name, _, class_name = target.partition(":")
+    
+    def factory() -> Screen:
+        screen_class = getattr(importlib.import_module(module_name), class_name)
+        return screen_class()
+    
+    return factory
+
 
 class GaleHunTUIApp(App):
 
@@ -39,16 +74,16 @@ class GaleHunTUIApp(App):
 
     SCREENS = {
         "home": HomeScreen,
-        "new_run": NewRunScreen,
-        "run_detail": RunDetailScreen,
-        "tools_manager": ToolsManagerScreen,
-        "deps_manager": DepsManagerScreen,
-        "settings": SettingsScreen,
-        "profiles": ProfilesScreen,
-        "scope": ScopeScreen,
-        "finding_detail": FindingDetailScreen,
-        "help": HelpScreen,
-        "setup": SetupWizardScreen,
+        "new_run": _lazy_screen("galehuntui.ui.screens.new_run:NewRunScreen"),
+        "run_detail": _lazy_screen("galehuntui.ui.screens.run_detail:RunDetailScreen"),
+        "tools_manager": _lazy_screen("galehuntui.ui.screens.tools_manager:ToolsManagerScreen"),
+        "deps_manager": _lazy_screen("galehuntui.ui.screens.deps_manager:DepsManagerScreen"),
+        "settings": _lazy_screen("galehuntui.ui.screens.settings:SettingsScreen"),
+        "profiles": _lazy_screen("galehuntui.ui.screens.profiles:ProfilesScreen"),
+        "scope": _lazy_screen("galehuntui.ui.screens.scope:ScopeScreen"),
+        "finding_detail": _lazy_screen("galehuntui.ui.screens.finding_detail:FindingDetailScreen"),
+        "help": _lazy_screen("galehuntui.ui.screens.help:HelpScreen"),
+        "setup": _lazy_screen("galehuntui.ui.screens.setup:SetupWizardScreen"),
     }
 
     def __init__(
@@ -64,6 +99,12 @@ class GaleHunTUIApp(App):
         self.current_run_id: Optional[str] = None
         self._theme_names = list(GALEHUNT_THEMES.keys())
 
+    def run(self, *args: Any, **kwargs: Any) -> Any:
+        # Textual creates its event loop inside run(), so the policy has
+        # to be in place before handing over
+        _use_uvloop()
+        return super().run(*args, **kwargs)
+
     def on_mount(self) -> None:
         self.title = "GaleHunTUI"
         
@@ -76,6 +117,10 @@ class GaleHunTUIApp(App):
         self._init_database()
         self.push_screen("home")
 
+    def on_unmount(self) -> None:
+        if self.db is not None:
+            self.db.close()
+
     def _init_database(self) -> None:
         try:
             data_dir = get_data_dir()
@@ -99,8 +144,12 @@ class GaleHunTUIApp(App):
             if not config_path.exists():
                 return DEFAULT_THEME
             
+            cached_theme = self._read_theme_cache(config_path)
+            if cached_theme is not None:
+                return cached_theme
+            
             with config_path.open("r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             
             if not config:
                 return DEFAULT_THEME
@@ -108,27 +157,56 @@ class GaleHunTUIApp(App):
             theme_value = config.get("theme", DEFAULT_THEME)
             
             if theme_value in LEGACY_THEME_MAPPING:
-                return LEGACY_THEME_MAPPING[theme_value]
+                theme = LEGACY_THEME_MAPPING[theme_value]
+            elif theme_value in GALEHUNT_THEMES:
+                theme = theme_value
+            else:
+                theme = DEFAULT_THEME
             
-            if theme_value in GALEHUNT_THEMES:
-                return theme_value
-            
-            return DEFAULT_THEME
+            self._write_theme_cache(config_path, theme)
+            return theme
             
         except Exception:
             return DEFAULT_THEME
 
-    def action_cycle_themes(self) -> None:
+    def _read_theme_cache(self, config_path: Path) -> Optional[str]:
+        # The sidecar holds the theme resolved from config.yaml; it is only
+        # trusted while it is at least as new as the config itself
+        cache_path = config_path.parent / THEME_CACHE_FILENAME
         try:
-            current_idx = self._theme_names.index(self.theme)
-            next_idx = (current_idx + 1) % len(self._theme_names)
-            new_theme = self._theme_names[next_idx]
-            
-            self.theme = new_theme
-            self.notify(f"Theme: {new_theme.title()}")
-        except (ValueError, IndexError):
-            self.theme = self._theme_names[0]
-            self.notify(f"Theme: {self._theme_names[0].title()}")
+            if os.stat(cache_path).st_mtime_ns < os.stat(config_path).st_mtime_ns:
+                return None
+            with cache_path.open("r") as f:
+                theme = f.read().strip()
+        except OSError:
+            return None
+        return theme if theme in GALEHUNT_THEMES else None
+
+    def _write_theme_cache(self, config_path: Path, theme: str) -> None:
+        try:
+            (config_path.parent / THEME_CACHE_FILENAME).write_text(theme)
+        except OSError:
+            pass
+
+    @property
+    def _theme_names(self) -> list[str]:
+        return self._theme_order
+
+    @_theme_names.setter
+    def _theme_names(self, names: list[str]) -> None:
+        # Keep a name -> position map alongside the cycle order so cycling
+        # is a dict lookup rather than a list scan
+        self._theme_order = list(names)
+        self._theme_index = {name: i for i, name in enumerate(self._theme_order)}
+
+    def action_cycle_themes(self) -> None:
+        # An unknown current theme maps to -1, so cycling starts at the first
+        current_idx = self._theme_index.get(self.theme, -1)
+        next_idx = (current_idx + 1) % len(self._theme_order)
+        new_theme = self._theme_order[next_idx]
+        
+        self.theme = new_theme
+        self.notify(f"Theme: {new_theme.title()}")
 
 if __name__ == "__main__":
     app = GaleHunTUIApp()
@@ -17,6 +17,18 @@ from galehuntui.tools.deps.manager import (
 )
 
 
+# Status cells are built once; rows get a copy so the table can never
+# restyle the shared instance
+_MISSING_TEXT = Text("Missing", style="bold red")
+_STATUS_TEXT = {
+    DependencyStatus.INSTALLED: Text("Installed", style="bold green"),
+    DependencyStatus.UPDATE_AVAILABLE: Text("Update Available", style="bold yellow"),
+    DependencyStatus.INSTALLING: Text("Installing...", style="bold blue"),
+    DependencyStatus.ERROR: Text("Error", style="bold red"),
+    DependencyStatus.NOT_INSTALLED: _MISSING_TEXT,
+}
+
+
 class DepsManagerScreen(Screen):
     """Screen for managing dependencies (Wordlists, Templates)."""
 
@@ -33,6 +45,8 @@ class DepsManagerScreen(Screen):
         deps_dir = get_deps_dir()
         self.manager = DependencyManager(deps_dir)
         self.selected_dep_id: str | None = None
+        # Dependencies with an install/update/verify currently running
+        self._inflight: set[str] = set()
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -64,11 +78,21 @@ class DepsManagerScreen(Screen):
         """Configure table columns."""
         table = self.query_one(f"#{table_id}", DataTable)
         table.add_column("Name", width=25)
-        table.add_column("Status", width=15)
+        table.add_column("Status", width=15, key="status")
         table.add_column("Version", width=15)
-        table.add_column("Description")
+        table.add_column("Description", width=60)
         table.zebra_stripes = True
 
+    def _update_row_status(self, dep_id: str, status_enum: DependencyStatus) -> None:
+        """Restyle one dependency's status cell without rebuilding the tables."""
+        for table_id in ("templates_table", "wordlists_table"):
+            table = self.query_one(f"#{table_id}", DataTable)
+            if dep_id in table.rows:
+                table.update_cell(dep_id, "status", _STATUS_TEXT[status_enum].copy())
+                return
+        # Not shown yet (e.g. first load still running): fall back to a reload
+        _ = self.load_deps()
+
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Track selected dependency."""
         row_key = event.row_key.value
@@ -84,93 +108,117 @@ class DepsManagerScreen(Screen):
             t_table = self.query_one("#templates_table", DataTable)
             w_table = self.query_one("#wordlists_table", DataTable)
             
-            t_table.clear()
-            w_table.clear()
+            t_rows: list[tuple[list[Any], str]] = []
+            w_rows: list[tuple[list[Any], str]] = []
             
             for dep in deps:
-                name = dep.name
-                status_enum = dep.status
-                version = dep.version or "-"
-                desc = dep.description
-                dtype = dep.type
-                
-                if status_enum == DependencyStatus.INSTALLED:
-                    status = Text("Installed", style="bold green")
-                elif status_enum == DependencyStatus.UPDATE_AVAILABLE:
-                    status = Text("Update Available", style="bold yellow")
-                elif status_enum == DependencyStatus.INSTALLING:
-                    status = Text("Installing...", style="bold blue")
-                elif status_enum == DependencyStatus.ERROR:
-                    status = Text("Error", style="bold red")
-                else:
-                    status = Text("Missing", style="bold red")
+                status = _STATUS_TEXT.get(dep.status, _MISSING_TEXT).copy()
                 
+                # Text cells skip DataTable's markup parse of plain str cells
                 row = [
-                    Text(name, style="bold"),
+                    Text(dep.name, style="bold"),
                     status,
-                    version,
-                    desc
+                    Text(dep.version or "-", style="dim"),
+                    Text(dep.description),
                 ]
                 
-                if dtype == DependencyType.TEMPLATES:
-                    t_table.add_row(*row, key=dep.id)
+                if dep.type == DependencyType.TEMPLATES:
+                    t_rows.append((row, dep.id))
                 else:
-                    w_table.add_row(*row, key=dep.id)
+                    w_rows.append((row, dep.id))
+            
+            # Clear and refill both tables under one batch so the screen
+            # repaints once instead of once per row
+            with self.app.batch_update():
+                t_table.clear()
+                w_table.clear()
+                for row, key in t_rows:
+                    t_table.add_row(*row, key=key)
+                for row, key in w_rows:
+                    w_table.add_row(*row, key=key)
                     
         except Exception as e:
             self.notify(f"Failed to load dependencies: {e}", severity="error")
 
+    def _claim_selected(self) -> str | None:
+        """Return the selected dependency id and mark it busy.
+        
+        Returns None (after telling the user why) when nothing is selected
+        or an action is already running on that dependency.
+        """
+        dep_id = self.selected_dep_id
+        if not dep_id:
+            self.notify("No dependency selected", severity="warning")
+            return None
+        if dep_id in self._inflight:
+            self.notify(f"{dep_id} is already busy", severity="warning")
+            return None
+        self._inflight.add(dep_id)
+        return dep_id
+
     @work
     async def action_install_dep(self) -> None:
         """Install the selected dependency."""
-        if not self.selected_dep_id:
-            self.notify("No dependency selected", severity="warning")
+        dep_id = self._claim_selected()
+        if dep_id is None:
             return
             
-        self.notify(f"Installing {self.selected_dep_id}...", severity="information")
+        self.notify(f"Installing {dep_id}...", severity="information")
         try:
-            await self.manager.install(self.selected_dep_id)
-            self.notify(f"Installed {self.selected_dep_id}", severity="information")
-            _ = self.load_deps()
+            await self.manager.install(dep_id)
+            self.notify(f"Installed {dep_id}", severity="information")
+            self._update_row_status(dep_id, DependencyStatus.INSTALLED)
         except Exception as e:
             self.notify(f"Failed to install: {e}", severity="error")
+            _ = self.load_deps()
+        finally:
+            self._inflight.discard(dep_id)
 
     @work
     async def action_update_dep(self) -> None:
         """Update the selected dependency."""
-        if not self.selected_dep_id:
-            self.notify("No dependency selected", severity="warning")
+        dep_id = self._claim_selected()
+        if dep_id is None:
             return
             
-        self.notify(f"Updating {self.selected_dep_id}...", severity="information")
+        self.notify(f"Updating {dep_id}...", severity="information")
         try:
-            result = await self.manager.update(self.selected_dep_id)
+            result = await self.manager.update(dep_id)
             if result:
-                self.notify(f"Updated {self.selected_dep_id}", severity="information")
+                self.notify(f"Updated {dep_id}", severity="information")
+                self._update_row_status(dep_id, DependencyStatus.INSTALLED)
             else:
-                self.notify(f"No update available for {self.selected_dep_id}", severity="warning")
-            _ = self.load_deps()
+                self.notify(f"No update available for {dep_id}", severity="warning")
         except Exception as e:
             self.notify(f"Failed to update: {e}", severity="error")
+            _ = self.load_deps()
+        finally:
+            self._inflight.discard(dep_id)
 
     @work
     async def action_verify_dep(self) -> None:
         """Verify the selected dependency."""
-        if not self.selected_dep_id:
-            self.notify("No dependency selected", severity="warning")
+        dep_id = self._claim_selected()
+        if dep_id is None:
             return
             
         try:
-            is_valid = await self.manager.verify(self.selected_dep_id)
+            is_valid = await self.manager.verify(dep_id)
             if is_valid:
-                self.notify(f"{self.selected_dep_id} is valid", severity="information")
+                self.notify(f"{dep_id} is valid", severity="information")
             else:
-                self.notify(f"{self.selected_dep_id} is invalid or missing", severity="error")
+                self.notify(f"{dep_id} is invalid or missing", severity="error")
             
-            # Refresh to update status if it changed
-            _ = self.load_deps()
+            # Reflect the result in the status column if it changed
+            self._update_row_status(
+                dep_id,
+                DependencyStatus.INSTALLED if is_valid else DependencyStatus.NOT_INSTALLED,
+            )
         except Exception as e:
             self.notify(f"Failed to verify: {e}", severity="error")
+            _ = self.load_deps()
+        finally:
+            self._inflight.discard(dep_id)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
@@ -1,9 +1,14 @@
-from typing import List, Optional
+import json
+from dataclasses import asdict
+from enum import Enum
+from functools import lru_cache
+from typing import Any, List, Optional
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Footer,
@@ -18,100 +23,46 @@ from textual.widgets import (
 from galehuntui.core.models import Finding, Severity, Confidence
 
 
-class FindingDetailScreen(Screen):
-    """Screen for viewing detailed information about a specific finding."""
+OVERVIEW_TAB_ID = "tab-overview"
+EVIDENCE_TAB_ID = "tab-evidence"
+REPRODUCTION_TAB_ID = "tab-reproduction"
+RAW_TAB_ID = "tab-raw"
 
-    CSS = """
-    FindingDetailScreen {
-        layout: vertical;
-    }
+# Held-down n/p repeats faster than this; only the last finding is rendered
+NAVIGATION_DEBOUNCE = 0.04
 
-    #finding-container {
-        height: 1fr;
-        padding: 1 2;
-    }
 
-    /* Summary Bar */
-    .summary-bar {
-        height: 3;
-        dock: top;
-        margin-bottom: 1;
-        background: #1a1c29;
-        border: solid #2e344d;
-        padding: 0 1;
-        align-y: middle;
-    }
+def _json_default(value: Any) -> Any:
+    # Enums serialize as their value; datetimes and the rest as str()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
 
-    .badge {
-        padding: 0 1;
-        margin-right: 1;
-        text-style: bold;
-        color: #0f111a;
-        background: #64748b;
-    }
 
-    .badge-critical { background: #ff3333; color: white; }
-    .badge-high { background: #ff3333; opacity: 80%; color: white; }
-    .badge-medium { background: #ffb700; color: #0f111a; }
-    .badge-low { background: #00ff9d; color: #0f111a; }
-    .badge-info { background: #00f2ea; color: #0f111a; }
+# Markdown sources are memoized on the finding text itself, so revisiting
+# a finding (or one sharing its remediation) skips rebuilding the string
+@lru_cache(maxsize=256)
+def _description_md(description: str) -> str:
+    return f"## Description\n\n{description or 'No description provided.'}"
 
-    .meta-item {
-        margin-right: 2;
-        color: #64748b;
-    }
-    
-    .meta-value {
-        color: #e2e8f0;
-        text-style: bold;
-    }
 
-    /* Main Content Layout */
-    .content-area {
-        height: 1fr;
-    }
+@lru_cache(maxsize=256)
+def _remediation_md(remediation: str, references: tuple[str, ...]) -> str:
+    refs = "\n\n### References\n" + "\n".join([f"- {ref}" for ref in references]) if references else ""
+    return f"## Remediation\n\n{remediation or 'No remediation steps provided.'}{refs}"
 
-    /* Sidebar Details */
-    .sidebar {
-        width: 30%;
-        height: 100%;
-        border-right: solid #2e344d;
-        padding-right: 1;
-        background: #0f111a;
-    }
 
-    .detail-group {
-        margin-bottom: 1;
-    }
+@lru_cache(maxsize=256)
+def _reproduction_md(steps: tuple[str, ...]) -> str:
+    if not steps:
+        return "_No reproduction steps provided._"
+    return "## Steps to Reproduce\n\n" + "\n".join([f"{i}. {step}" for i, step in enumerate(steps, 1)])
 
-    .detail-label {
-        color: #00f2ea;
-        text-style: bold;
-    }
 
-    .detail-value {
-        color: #e2e8f0;
-    }
+class FindingDetailScreen(Screen):
+    """Screen for viewing detailed information about a specific finding."""
 
-    /* Main Tab Area */
-    .main-tabs {
-        width: 70%;
-        height: 100%;
-        padding-left: 1;
-    }
-    
-    Markdown {
-        padding: 1;
-        background: #0f111a;
-    }
-    
-    .evidence-item {
-        padding: 1;
-        border: solid #2e344d;
-        margin-bottom: 1;
-        background: #1a1c29;
-    }
-    """
+    CSS_PATH = "../styles/finding_detail.tcss"
 
     BINDINGS = [
         Binding("escape", "app.pop_screen", "Back"),
@@ -119,6 +70,14 @@ class FindingDetailScreen(Screen):
         Binding("p", "prev_finding", "Previous Finding"),
     ]
 
+    # Tab pane id -> method that fills it from a finding
+    _TAB_RENDERERS = {
+        OVERVIEW_TAB_ID: "_render_overview",
+        EVIDENCE_TAB_ID: "_render_evidence",
+        REPRODUCTION_TAB_ID: "_render_reproduction",
+        RAW_TAB_ID: "_render_raw",
+    }
+
     def __init__(
         self,
         findings: Optional[List[Finding]] = None,
@@ -130,6 +89,12 @@ class FindingDetailScreen(Screen):
         super().__init__(name=name, id=id, classes=classes)
         self.findings = findings or []
         self.current_index = max(0, min(initial_index, len(self.findings) - 1)) if self.findings else 0
+        self._md_sources: dict[Markdown, str] = {}
+        self._raw_cache: dict[str, str] = {}
+        self._pending_timer: Optional[Timer] = None
+        self._dirty_tabs: set[str] = set()
+        self._boundary_notified = False
+        self._evidence_labels: list[Label] = []
 
     def get_current_finding(self) -> Optional[Finding]:
         if not self.findings:
@@ -137,7 +102,7 @@ class FindingDetailScreen(Screen):
         return self.findings[self.current_index]
 
     def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
+        yield Header()
         
         with Container(id="finding-container"):
             # Top Summary Bar
@@ -148,6 +113,7 @@ class FindingDetailScreen(Screen):
                 yield Label("", id="tool-name", classes="meta-value")
                 yield Label("Type: ", classes="meta-item")
                 yield Label("", id="vuln-type", classes="meta-value")
+                yield Static(id="finding-counter", classes="meta-item")
 
             # Main Content Split
             with Horizontal(classes="content-area"):
@@ -162,19 +128,19 @@ class FindingDetailScreen(Screen):
                         self._detail_item("Run ID", "run-id-value")
 
                 # Right Content
-                with TabbedContent(classes="main-tabs"):
-                    with TabPane("Overview"):
+                with TabbedContent(id="finding-tabs", classes="main-tabs"):
+                    with TabPane("Overview", id=OVERVIEW_TAB_ID):
                         yield Markdown(id="md-description")
                         yield Markdown(id="md-remediation")
                     
-                    with TabPane("Evidence"):
+                    with TabPane("Evidence", id=EVIDENCE_TAB_ID):
                         yield VerticalScroll(id="evidence-list")
                     
-                    with TabPane("Reproduction"):
+                    with TabPane("Reproduction", id=REPRODUCTION_TAB_ID):
                         yield Markdown(id="md-reproduction")
                         
-                    with TabPane("Raw Data"):
-                         yield Markdown(id="md-raw")
+                    with TabPane("Raw Data", id=RAW_TAB_ID):
+                        yield Markdown(id="md-raw")
 
         yield Footer()
 
@@ -185,23 +151,66 @@ class FindingDetailScreen(Screen):
 
     def on_mount(self) -> None:
         """Load initial data."""
+        # Resolve every widget update_view touches once, instead of a
+        # selector query per widget on each n/p keypress
+        self._finding_counter: Static = self.query_one("#finding-counter", Static)
+        self._severity_badge: Static = self.query_one("#severity-badge", Static)
+        self._confidence_badge: Static = self.query_one("#confidence-badge", Static)
+        self._tool_name: Label = self.query_one("#tool-name", Label)
+        self._vuln_type: Label = self.query_one("#vuln-type", Label)
+        self._id_value: Label = self.query_one("#id-value", Label)
+        self._host_value: Label = self.query_one("#host-value", Label)
+        self._url_value: Label = self.query_one("#url-value", Label)
+        self._param_value: Label = self.query_one("#param-value", Label)
+        self._time_value: Label = self.query_one("#time-value", Label)
+        self._run_id_value: Label = self.query_one("#run-id-value", Label)
+        self._description: Markdown = self.query_one("#md-description", Markdown)
+        self._remediation: Markdown = self.query_one("#md-remediation", Markdown)
+        self._evidence_list: VerticalScroll = self.query_one("#evidence-list", VerticalScroll)
+        self._reproduction: Markdown = self.query_one("#md-reproduction", Markdown)
+        self._raw: Markdown = self.query_one("#md-raw", Markdown)
+        self._tabs: TabbedContent = self.query_one("#finding-tabs", TabbedContent)
+        self.title = "Finding Details"
         self.update_view()
 
     def action_next_finding(self) -> None:
         """Show next finding."""
         if self.current_index < len(self.findings) - 1:
+            self._boundary_notified = False
             self.current_index += 1
-            self.update_view()
+            self._schedule_update_view()
         else:
-            self.notify("End of findings list")
+            self._notify_boundary("End of findings list")
 
     def action_prev_finding(self) -> None:
         """Show previous finding."""
         if self.current_index > 0:
+            self._boundary_notified = False
             self.current_index -= 1
-            self.update_view()
+            self._schedule_update_view()
         else:
-            self.notify("Start of findings list")
+            self._notify_boundary("Start of findings list")
+
+    def _notify_boundary(self, message: str) -> None:
+        # A held key keeps hitting the end of the list; toast only once
+        # until the user navigates away from it
+        if not self._boundary_notified:
+            self._boundary_notified = True
+            self.notify(message)
+
+    def _schedule_update_view(self) -> None:
+        # Restart the timer on each keypress so a burst renders once
+        if self._pending_timer is not None:
+            self._pending_timer.stop()
+        self._pending_timer = self.set_timer(NAVIGATION_DEBOUNCE, self.update_view)
+
+    def _update_markdown(self, widget: Markdown, source: str) -> None:
+        # Consecutive findings often share text (e.g. remediation), and a
+        # Markdown update re-parses and re-renders even when nothing changed
+        if self._md_sources.get(widget) == source:
+            return
+        self._md_sources[widget] = source
+        widget.update(source)
 
     def update_view(self) -> None:
         """Update all widgets with current finding data."""
@@ -209,57 +218,85 @@ class FindingDetailScreen(Screen):
         if not finding:
             return
 
-        self.title = f"Finding: {finding.title}"
-        self.sub_title = f"{self.current_index + 1} of {len(self.findings)}"
+        # Position and title live in the summary bar: changing the screen
+        # title on every n/p would repaint the Header as well
+        self._finding_counter.update(
+            f"{self.current_index + 1}/{len(self.findings)} — {finding.title}"
+        )
 
         # Summary Bar
-        sev_badge = self.query_one("#severity-badge", Static)
+        sev_badge = self._severity_badge
         sev_badge.update(finding.severity.value.upper())
         sev_badge.classes = f"badge badge-{finding.severity.value.lower()}"
 
-        conf_badge = self.query_one("#confidence-badge", Static)
+        conf_badge = self._confidence_badge
         conf_badge.update(finding.confidence.value.upper())
         # Re-use severity colors or add specific confidence styles if needed
         # For now, just generic badge style or maybe map confirmation to success/warning
         
-        self.query_one("#tool-name", Label).update(finding.tool)
-        self.query_one("#vuln-type", Label).update(finding.type)
+        self._tool_name.update(finding.tool)
+        self._vuln_type.update(finding.type)
 
         # Sidebar Details
-        self.query_one("#id-value", Label).update(str(finding.id))
-        self.query_one("#host-value", Label).update(finding.host)
-        self.query_one("#url-value", Label).update(finding.url)
-        self.query_one("#param-value", Label).update(finding.parameter or "N/A")
-        self.query_one("#time-value", Label).update(str(finding.timestamp))
-        self.query_one("#run-id-value", Label).update(str(finding.run_id))
-
-        # Markdown Content
-        desc_md = f"## Description\n\n{finding.description or 'No description provided.'}"
-        self.query_one("#md-description", Markdown).update(desc_md)
-
-        rem_md = f"## Remediation\n\n{finding.remediation or 'No remediation steps provided.'}"
-        if finding.references:
-            rem_md += "\n\n### References\n" + "\n".join(f"- {ref}" for ref in finding.references)
-        self.query_one("#md-remediation", Markdown).update(rem_md)
-
-        # Evidence
-        evidence_container = self.query_one("#evidence-list", VerticalScroll)
-        evidence_container.remove_children()
-        
-        if finding.evidence_paths:
-            for path in finding.evidence_paths:
-                evidence_container.mount(
-                    Label(f"📄 {path}", classes="evidence-item")
-                )
-        else:
-            evidence_container.mount(Label("No evidence files attached.", classes="text-muted"))
-
-        # Reproduction
-        if finding.reproduction_steps:
-            steps_md = "## Steps to Reproduce\n\n" + "\n".join(f"{i+1}. {step}" for i, step in enumerate(finding.reproduction_steps))
-            self.query_one("#md-reproduction", Markdown).update(steps_md)
-        else:
-            self.query_one("#md-reproduction", Markdown).update("_No reproduction steps provided._")
+        self._id_value.update(str(finding.id))
+        self._host_value.update(finding.host)
+        self._url_value.update(finding.url)
+        self._param_value.update(finding.parameter or "N/A")
+        self._time_value.update(str(finding.timestamp))
+        self._run_id_value.update(str(finding.run_id))
+
+        # Only the visible tab is rendered now; the rest are marked stale
+        # and filled in when the user switches to them
+        self._dirty_tabs = set(self._TAB_RENDERERS)
+        self._render_tab(self._tabs.active, finding)
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Render a tab that went stale while it was hidden."""
+        finding = self.get_current_finding()
+        if finding:
+            self._render_tab(event.pane.id, finding)
 
-        # Raw Data (Placeholder if we don't have direct access to raw output content here)
-        self.query_one("#md-raw", Markdown).update(f"```json\n{finding}\n```")
+    def _render_tab(self, tab_id: Optional[str], finding: Finding) -> None:
+        if tab_id not in self._dirty_tabs:
+            return
+        self._dirty_tabs.discard(tab_id)
+        getattr(self, self._TAB_RENDERERS[tab_id])(finding)
+
+    def _render_overview(self, finding: Finding) -> None:
+        self._update_markdown(self._description, _description_md(finding.description or ""))
+        self._update_markdown(
+            self._remediation,
+            _remediation_md(finding.remediation or "", tuple(finding.references)),
+        )
+
+    def _render_evidence(self, finding: Finding) -> None:
+        texts = [f"📄 {path}" for path in finding.evidence_paths]
+        
+        # Same number of paths as the last finding: retext the mounted
+        # labels rather than tearing them down and mounting new ones
+        if texts and len(texts) == len(self._evidence_labels):
+            for label, text in zip(self._evidence_labels, texts):
+                label.update(text)
+            return
+        
+        self._evidence_labels = [Label(text, classes="evidence-item") for text in texts]
+        labels = self._evidence_labels or [
+            Label("No evidence files attached.", classes="text-muted")
+        ]
+        
+        # Swap the whole list in one go: one layout pass, not one per label
+        with self.app.batch_update():
+            self._evidence_list.remove_children()
+            self._evidence_list.mount_all(labels)
+
+    def _render_reproduction(self, finding: Finding) -> None:
+        self._update_markdown(
+            self._reproduction, _reproduction_md(tuple(finding.reproduction_steps))
+        )
+
+    def _render_raw(self, finding: Finding) -> None:
+        raw = self._raw_cache.get(finding.id)
+        if raw is None:
+            raw = json.dumps(asdict(finding), default=_json_default, indent=2)
+            self._raw_cache[finding.id] = raw
+        self._update_markdown(self._raw, f"```json\n{raw}\n```")
@@ -7,10 +7,8 @@ from textual.widgets import (
     Markdown,
     TabbedContent,
     TabPane,
-    Label,
-    Button
 )
-from textual.containers import Container, Vertical
+from textual.containers import Container
 from textual.binding import Binding
 
 HELP_MD = """
@@ -60,6 +58,20 @@ Powered by amazing open-source tools:
 - textual (Textualize)
 """
 
+SHORTCUTS: tuple[tuple[str, str, str], ...] = (
+    ("?", "Global", "Show Help (this screen)"),
+    ("Esc", "Global", "Back / Cancel"),
+    ("Ctrl+Q", "Global", "Quit Application"),
+    ("Ctrl+S", "Global", "Save Settings / Configuration"),
+    ("Ctrl+T", "Global", "Open Tools Manager"),
+    ("Ctrl+N", "Global", "Start New Run"),
+    ("Tab", "Forms", "Next Field"),
+    ("/", "Lists", "Search / Filter"),
+    ("j / k", "Navigation", "Move Up / Down"),
+    ("g / G", "Navigation", "Go to Top / Bottom"),
+    ("Enter", "Controls", "Select / Activate"),
+)
+
 class HelpScreen(Screen):
     """Screen for displaying help and documentation."""
 
@@ -86,19 +98,5 @@ class HelpScreen(Screen):
         table = self.query_one(DataTable)
         table.add_columns("Key", "Context", "Action")
         
-        shortcuts = [
-            ("?", "Global", "Show Help (this screen)"),
-            ("Esc", "Global", "Back / Cancel"),
-            ("Ctrl+Q", "Global", "Quit Application"),
-            ("Ctrl+S", "Global", "Save Settings / Configuration"),
-            ("Ctrl+T", "Global", "Open Tools Manager"),
-            ("Ctrl+N", "Global", "Start New Run"),
-            ("Tab", "Forms", "Next Field"),
-            ("/", "Lists", "Search / Filter"),
-            ("j / k", "Navigation", "Move Up / Down"),
-            ("g / G", "Navigation", "Go to Top / Bottom"),
-            ("Enter", "Controls", "Select / Activate"),
-        ]
-        
-        table.add_rows(shortcuts)
+        table.add_rows(SHORTCUTS)
         table.focus()
@@ -1,23 +1,69 @@
-from datetime import datetime
+import os
+import shutil
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
-from textual.widgets import Header, Footer, Button, DataTable, Static, Label, Digits
+from textual.timer import Timer
+from textual.widgets import Header, Footer, Button, DataTable, Label
 from textual.containers import Container, Horizontal, Vertical
 from textual.binding import Binding
 
 from galehuntui.storage.database import Database
 from galehuntui.core.config import get_data_dir
-from galehuntui.core.models import RunState, Severity, RunMetadata
-from galehuntui.core.utils import categorize_findings
-from galehuntui.tools.installer import ToolInstaller
+from galehuntui.core.models import RunMetadata
+
+
+# Seconds a dashboard snapshot may be reused when the database files are
+# unchanged; deletes from this screen drop it straight away
+DASHBOARD_CACHE_TTL = 5.0
+
+# Reload requests arriving within this window (mount, resume, delete in
+# quick succession) are collapsed into one dashboard load
+RELOAD_DEBOUNCE = 0.1
+
+
+@lru_cache(maxsize=1)
+def _docker_path() -> Optional[str]:
+    # which() stats every PATH entry; docker rarely appears or disappears
+    # mid-session, so the answer is kept until the user refreshes status
+    return shutil.which("docker")
+
+
+@lru_cache(maxsize=1)
+def _default_db_path() -> Path:
+    # get_data_dir() mkdirs on every call; the location never changes
+    return get_data_dir() / "galehuntui.db"
+
+
+def _db_stamp(db_path: Path) -> Optional[tuple[int, ...]]:
+    # In WAL mode commits land in the -wal file first, so both files are
+    # part of the stamp; None means the database cannot be stat'ed
+    try:
+        db_stat = os.stat(db_path)
+    except OSError:
+        return None
+    try:
+        wal_stat = os.stat(f"{db_path}-wal")
+    except OSError:
+        return (db_stat.st_mtime_ns, db_stat.st_size)
+    return (db_stat.st_mtime_ns, db_stat.st_size, wal_stat.st_mtime_ns, wal_stat.st_size)
+
 
 class HomeScreen(Screen):
     """The main dashboard screen of GaleHunTUI."""
 
+    # (monotonic time, database stamp, (stats, rows)) of the last load
+    _dashboard_cache: Optional[tuple[float, Optional[tuple[int, ...]], tuple]] = None
+
+    _pending_reload: Optional[Timer] = None
+
     BINDINGS = [
         Binding("n", "new_run", "New Run", priority=True),
         Binding("t", "tools_manager", "Tools", priority=True),
@@ -25,156 +71,10 @@ class HomeScreen(Screen):
         Binding("p", "profiles", "Profiles", priority=True),
         Binding("d", "delete_run", "Delete", priority=True),
         Binding("enter", "view_run", "View", priority=True),
+        Binding("r", "refresh_status", "Refresh", priority=True),
     ]
 
-    CSS = """
-    HomeScreen {
-        align: center middle;
-    }
-
-    #home-container {
-        width: 100%;
-        height: 100%;
-        layout: grid;
-        grid-size: 2;
-        grid-columns: 3fr 1.2fr;
-        grid-rows: auto auto 1fr;
-        grid-gutter: 1;
-        padding: 1;
-    }
-
-    #hero-panel {
-        column-span: 2;
-        height: 7;
-        background: #1a1c29;
-        border: solid #2e344d;
-        padding: 1 2;
-        layout: horizontal;
-    }
-
-    .hero-left {
-        width: 3fr;
-        height: 100%;
-        content-align: left middle;
-    }
-
-    .hero-title {
-        text-style: bold;
-        color: #00f2ea;
-    }
-
-    .hero-subtitle {
-        color: #64748b;
-    }
-
-    .hero-actions {
-        width: 1fr;
-        height: 100%;
-    }
-
-    .hero-actions Button {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    /* Stats Panel */
-    #stats-grid {
-        column-span: 2;
-        height: 7;
-        layout: grid;
-        grid-size: 4;
-        grid-columns: 1fr 1fr 1fr 1fr;
-        grid-rows: 1;
-        grid-gutter: 1;
-    }
-
-    .stat-card {
-        height: 100%;
-        align: center middle;
-        background: #1a1c29;
-        border: solid #2e344d;
-        padding: 1;
-    }
-
-    .stat-value {
-        text-align: center;
-        color: #00f2ea;
-        text-style: bold;
-        width: 100%;
-        content-align: center middle;
-    }
-
-    .stat-label {
-        text-align: center;
-        color: #64748b;
-        width: 100%;
-    }
-
-    /* Recent Runs Table */
-    #recent-runs-container {
-        height: 100%;
-        border: solid #2e344d;
-        background: #0f111a;
-        row-span: 1;
-    }
-
-    DataTable {
-        height: 100%;
-        background: #0f111a;
-        border: none;
-    }
-
-    DataTable > .datatable--header {
-        background: #1a1c29;
-        color: #00f2ea;
-        text-style: bold;
-    }
-
-    /* Side Panel */
-    #side-panel {
-        height: 100%;
-        layout: vertical;
-    }
-
-    .panel-header {
-        background: #1a1c29;
-        color: #00f2ea;
-        text-style: bold;
-        padding: 0 1;
-        height: 1;
-        margin-bottom: 1;
-        width: 100%;
-    }
-
-    .action-button {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .status-box {
-        background: #1a1c29;
-        border: solid #2e344d;
-        padding: 1;
-        height: auto;
-        margin-bottom: 1;
-    }
-
-    .status-row {
-        layout: horizontal;
-        height: 1;
-        margin-bottom: 0;
-        width: 100%;
-    }
-
-    .status-dot {
-        color: #00ff9d;
-        margin-right: 1;
-    }
-
-    .status-text {
-        color: #64748b;
-    }
-    """
+    CSS_PATH = "../styles/home.tcss"
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -236,6 +136,23 @@ class HomeScreen(Screen):
             classes="status-row"
         )
 
+    def _db_path(self) -> Path:
+        db = getattr(self.app, "db", None)
+        if db is not None:
+            return db.db_path
+        return _default_db_path()
+
+    @contextmanager
+    def _database(self) -> Iterator[Database]:
+        """Yield the app's long-lived connection, or a one-off if it has none."""
+        db = getattr(self.app, "db", None)
+        if db is not None:
+            yield db
+            return
+        with Database(self._db_path()) as db:
+            db.init_db()
+            yield db
+
     def _get_step_output_count(self, run: RunMetadata, step_name: str) -> int:
         """Count items in a step output file."""
         try:
@@ -251,26 +168,42 @@ class HomeScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize data when screen is mounted."""
-        table = self.query_one("#recent_runs_table", DataTable)
-        table.add_columns("ID", "Target", "Profile", "Status", "Subdomain", "Live", "Findings", "Date")
+        # Resolve the widgets each dashboard load touches once, instead of
+        # a selector query per widget on every refresh
+        self._status_db: Label = self.query_one("#status_db", Label)
+        self._status_docker: Label = self.query_one("#status_docker", Label)
+        self._stat_labels: tuple[Label, Label, Label, Label] = (
+            self.query_one("#stat_total_runs", Label),
+            self.query_one("#stat_subdomains", Label),
+            self.query_one("#stat_live_hosts", Label),
+            self.query_one("#stat_findings", Label),
+        )
+        self._runs_table: DataTable = self.query_one("#recent_runs_table", DataTable)
+        
+        self._runs_table.add_columns("ID", "Target", "Profile", "Status", "Subdomain", "Live", "Findings", "Date")
         
         # Load real data in background
-        _ = self._load_dashboard_data()
+        self._request_reload()
 
     def on_screen_resume(self) -> None:
         """Refresh data when returning to this screen."""
-        _ = self._load_dashboard_data()
+        self._request_reload()
+
+    def _request_reload(self) -> None:
+        """Schedule a dashboard load, restarting any pending one."""
+        if self._pending_reload is not None:
+            self._pending_reload.stop()
+        self._pending_reload = self.set_timer(RELOAD_DEBOUNCE, self._load_dashboard_data)
 
     @work(exclusive=True)
     async def _load_dashboard_data(self) -> None:
         """Load dashboard data from database in background."""
         try:
-            data_dir = get_data_dir()
-            db_path = data_dir / "galehuntui.db"
+            db_path = self._db_path()
             
             # Update DB Status
-            db_status_label = self.query_one("#status_db", Label)
-            if db_path.exists():
+            db_status_label = self._status_db
+            if getattr(self.app, "db", None) is not None or db_path.exists():
                 db_status_label.update("Database: Connected")
                 db_status_label.styles.color = "green"
             else:
@@ -279,9 +212,8 @@ class HomeScreen(Screen):
             # Check Docker (simple check)
             # In a real scenario, we might want to check if docker socket exists or run a command
             # For now, we'll check if docker command is available
-            import shutil
-            docker_path = shutil.which("docker")
-            docker_status_label = self.query_one("#status_docker", Label)
+            docker_path = _docker_path()
+            docker_status_label = self._status_docker
             if docker_path:
                 docker_status_label.update("Docker: Available")
                 # docker_status_label.styles.color = "green" # Default text color is fine
@@ -289,71 +221,95 @@ class HomeScreen(Screen):
                 docker_status_label.update("Docker: Not Found")
                 docker_status_label.styles.color = "red"
 
-            runs = []
-            total_runs_count = 0
-            total_subdomains = 0
-            total_live_hosts = 0
-            total_findings = 0
-            
-            with Database(db_path) as db:
-                db.init_db()
-                runs = db.list_runs(limit=10)
-                
-                all_runs = db.list_runs(limit=1000)
-                total_runs_count = len(all_runs)
-                
-                for run in all_runs:
-                    findings = db.get_findings_for_run(run.id)
-                    counts = categorize_findings(findings)
-                    total_subdomains += counts.subdomain
-                    total_live_hosts += counts.live_domain
-                    total_findings += counts.findings
-
-            self.query_one("#stat_total_runs", Label).update(str(total_runs_count))
-            self.query_one("#stat_subdomains", Label).update(str(total_subdomains))
-            self.query_one("#stat_live_hosts", Label).update(str(total_live_hosts))
-            self.query_one("#stat_findings", Label).update(str(total_findings))
-
-            # Update Table
-            table = self.query_one("#recent_runs_table", DataTable)
-            table.clear()
-            
-            with Database(db_path) as db:
-                for run in runs:
-                    status = run.state.value.title()
-                    
-                    findings = db.get_findings_for_run(run.id)
-                    counts = categorize_findings(findings)
-                    
-                    subdomain_count = counts.subdomain
-                    live_count = counts.live_domain
-                    finding_count = counts.findings
-                    
-                    findings_text = str(finding_count)
-                    if finding_count > 0:
-                        crit = sum(1 for f in findings if f.severity == Severity.CRITICAL and f.type.lower() not in ("subdomain", "dns_record", "http_probe") and f.tool.lower() not in ("subfinder", "dnsx", "httpx"))
-                        high = sum(1 for f in findings if f.severity == Severity.HIGH and f.type.lower() not in ("subdomain", "dns_record", "http_probe") and f.tool.lower() not in ("subfinder", "dnsx", "httpx"))
-                        if crit > 0:
-                            findings_text = f"{finding_count} ({crit}C)"
-                        elif high > 0:
-                            findings_text = f"{finding_count} ({high}H)"
-
-                    date_str = run.created_at.strftime("%Y-%m-%d %H:%M")
-                    
-                    table.add_row(
-                        run.id[:8],
-                        run.target,
-                        run.profile.title(),
-                        status,
-                        str(subdomain_count) if subdomain_count > 0 else "-",
-                        str(live_count) if live_count > 0 else "-",
-                        findings_text if finding_count > 0 else "-",
-                        date_str
-                    )
+            # Resuming the screen usually finds the database untouched;
+            # reuse the last snapshot while it is fresh and nothing was written
+            stamp = _db_stamp(db_path)
+            cached = HomeScreen._dashboard_cache
+            if (
+                cached is not None
+                and stamp is not None
+                and cached[1] == stamp
+                and time.monotonic() - cached[0] < DASHBOARD_CACHE_TTL
+            ):
+                stats, rows = cached[2]
+            else:
+                stats, rows = self._query_dashboard()
+                HomeScreen._dashboard_cache = (time.monotonic(), stamp, (stats, rows))
+
+            table = self._runs_table
+
+            # Stat cards and table change together under one batch, so the
+            # screen repaints once instead of once per label and row
+            with self.app.batch_update():
+                # Labels are in the same order as the stats tuple
+                for label, value in zip(self._stat_labels, stats):
+                    label.update(str(value))
+
+                # Rows are swapped in only once all queries are done, so the
+                # table is never left half-filled while the database is read.
+                # add_rows takes no keys, so rows are added one by one here.
+                table.clear()
+                for run_id, cells in rows:
+                    table.add_row(*cells, key=run_id)
 
         except Exception as e:
             self.notify(f"Failed to load dashboard data: {e}", severity="error")
 
+    def _query_dashboard(self) -> tuple[tuple[int, int, int, int], list[tuple[str, tuple[str, ...]]]]:
+        """Read the stat card totals and recent-run rows from the database."""
+        with self._database() as db:
+            runs = db.list_runs(limit=10)
+            
+            # Totals come straight from SQL aggregates rather than
+            # loading every run and its findings
+            total_runs_count = db.count_runs()
+            totals = db.get_finding_totals()
+            stats = (total_runs_count, totals.subdomain, totals.live_domain, totals.findings)
+            
+            # Counts for every recent run come from one grouped query
+            # instead of loading each run's findings
+            run_counts = db.get_finding_counts_by_run([run.id for run in runs])
+
+        # (full run id, cells); the id becomes the row key so selection
+        # never has to map the short id back through the database
+        rows: list[tuple[str, tuple[str, ...]]] = []
+        
+        date_format = "%Y-%m-%d %H:%M"
+        
+        for run in runs:
+            status = run.state.value.title()
+            counts = run_counts[run.id]
+            
+            subdomain_count = counts["subdomain"]
+            live_count = counts["live_domain"]
+            finding_count = counts["findings"]
+            
+            findings_text = str(finding_count)
+            if counts["critical"] > 0:
+                findings_text = f"{finding_count} ({counts['critical']}C)"
+            elif counts["high"] > 0:
+                findings_text = f"{finding_count} ({counts['high']}H)"
+
+            date_str = run.created_at.strftime(date_format)
+            
+            rows.append((run.id, (
+                run.id[:8],
+                run.target,
+                run.profile.title(),
+                status,
+                str(subdomain_count) if subdomain_count > 0 else "-",
+                str(live_count) if live_count > 0 else "-",
+                findings_text if finding_count > 0 else "-",
+                date_str
+            )))
+        
+        return stats, rows
+
+    def action_refresh_status(self) -> None:
+        """Re-detect system status and reload the dashboard."""
+        _docker_path.cache_clear()
+        HomeScreen._dashboard_cache = None
+        self._request_reload()
 
     def action_new_run(self) -> None:
         self.app.push_screen("new_run")
@@ -383,7 +339,7 @@ class HomeScreen(Screen):
 
     def _get_selected_run_id(self) -> Optional[str]:
         """Get the full run ID from the selected table row."""
-        table = self.query_one("#recent_runs_table", DataTable)
+        table = self._runs_table
         
         if table.row_count == 0:
             return None
@@ -393,20 +349,8 @@ class HomeScreen(Screen):
             if row_index is None or row_index < 0:
                 return None
             
-            row_data = table.get_row_at(row_index)
-            if not row_data:
-                return None
-            
-            short_id = str(row_data[0])
-            
-            data_dir = get_data_dir()
-            db_path = data_dir / "galehuntui.db"
-            
-            with Database(db_path) as db:
-                runs = db.list_runs(limit=100)
-                for run in runs:
-                    if run.id.startswith(short_id):
-                        return run.id
+            # Rows are keyed by the full run id when the table is filled
+            return table.ordered_rows[row_index].key.value
         except Exception as e:
             self.notify(f"Error: {e}", severity="error")
         return None
@@ -487,15 +431,13 @@ class HomeScreen(Screen):
     async def _do_delete(self, run_id: str) -> None:
         """Perform the actual deletion."""
         try:
-            data_dir = get_data_dir()
-            db_path = data_dir / "galehuntui.db"
-            
-            with Database(db_path) as db:
+            with self._database() as db:
                 success = db.delete_run(run_id)
                 
             if success:
                 self.notify(f"Run {run_id[:8]} deleted", severity="information")
-                _ = self._load_dashboard_data()
+                HomeScreen._dashboard_cache = None
+                self._request_reload()
             else:
                 self.notify(f"Failed to delete run", severity="error")
                 
@@ -289,6 +289,8 @@ class SetupWizardScreen(Screen):
                 
                 bar.advance(1)
             
+            await installer.aclose()
+            
             if failed:
                 status.update(f"⚠️ Installed with errors: {len(failed)} failed")
                 status.styles.color = "yellow"
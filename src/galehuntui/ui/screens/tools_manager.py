@@ -60,6 +60,10 @@ class ToolsManagerScreen(Screen):
         # Start loading tools in background
         _ = self.load_tools()
 
+    async def on_unmount(self) -> None:
+        """Release pooled HTTP connections held by the installer."""
+        await self.installer.aclose()
+
     def _setup_table(self, table_id: str) -> None:
         """Configure table columns."""
         table = self.query_one(f"#{table_id}", DataTable)
@@ -151,7 +155,7 @@ class ToolsManagerScreen(Screen):
             self.notify("No tool selected", severity="warning")
             return
             
-        is_valid = self.installer.verify_tool(tool_id)
+        is_valid = self.installer.verify_tool(tool_id, refresh=True)
         if is_valid:
             self.notify(f"{tool_id} is correctly installed", severity="information")
         else:
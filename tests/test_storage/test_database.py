@@ -91,6 +91,12 @@ class TestDatabaseInitialization(unittest.TestCase):
             WHERE type='index' AND name='idx_runs_state'
         """)
         self.assertIsNotNone(cursor.fetchone())
+        
+        cursor.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='index' AND name='idx_findings_run_category'
+        """)
+        self.assertIsNotNone(cursor.fetchone())
     
     def test_init_db_idempotent(self):
         """Test that init_db can be called multiple times safely."""
@@ -337,6 +343,15 @@ class TestRunOperations(unittest.TestCase):
         self.assertEqual(len(completed_runs), 1)
         self.assertEqual(completed_runs[0].id, run3.id)
     
+    def test_count_runs(self):
+        """Test counting runs."""
+        self.assertEqual(self.db.count_runs(), 0)
+        
+        for i in range(3):
+            self.db.save_run(self._create_sample_run(str(uuid4())))
+        
+        self.assertEqual(self.db.count_runs(), 3)
+    
     def test_delete_run(self):
         """Test deleting a run."""
         run = self._create_sample_run()
@@ -597,6 +612,62 @@ class TestFindingOperations(unittest.TestCase):
         """Test getting findings for a run that doesn't exist."""
         findings = self.db.get_findings_for_run("nonexistent-run-id")
         self.assertEqual(len(findings), 0)
+    
+    def test_get_finding_totals(self):
+        """Test aggregate counts match categorize_findings."""
+        from galehuntui.core.utils import categorize_findings
+        
+        samples = [
+            ("subdomain", "subfinder", Severity.INFO),
+            ("dns_record", "dnsx", Severity.INFO),
+            ("http_probe", "httpx", Severity.INFO),
+            ("tech", "nuclei", Severity.INFO),
+            ("xss", "dalfox", Severity.HIGH),
+            ("SQLi", "sqlmap", Severity.CRITICAL),
+        ]
+        for ftype, tool, severity in samples:
+            finding = self._create_sample_finding(severity=severity)
+            finding.type = ftype
+            finding.tool = tool
+            self.db.save_finding(finding)
+        
+        totals = self.db.get_finding_totals()
+        expected = categorize_findings(self.db.get_findings_for_run(self.run_id))
+        self.assertEqual(totals, expected)
+        self.assertEqual(totals.subdomain, 2)
+        self.assertEqual(totals.live_domain, 1)
+        self.assertEqual(totals.info, 1)
+        self.assertEqual(totals.findings, 2)
+    
+    def test_get_finding_counts_by_run(self):
+        """Test per-run aggregate counts including critical/high."""
+        samples = [
+            ("subdomain", "subfinder", Severity.INFO),
+            ("http_probe", "httpx", Severity.CRITICAL),
+            ("xss", "dalfox", Severity.HIGH),
+            ("sqli", "sqlmap", Severity.CRITICAL),
+            ("tech", "nuclei", Severity.INFO),
+        ]
+        for ftype, tool, severity in samples:
+            finding = self._create_sample_finding(severity=severity)
+            finding.type = ftype
+            finding.tool = tool
+            self.db.save_finding(finding)
+        
+        counts = self.db.get_finding_counts_by_run([self.run_id, "missing-run"])
+        self.assertEqual(counts[self.run_id], {
+            "subdomain": 1, "live_domain": 1, "findings": 2, "info": 1,
+            "critical": 1, "high": 1,
+        })
+        self.assertEqual(counts["missing-run"]["findings"], 0)
+        self.assertEqual(self.db.get_finding_counts_by_run([]), {})
+    
+    def test_get_finding_totals_empty(self):
+        """Test aggregate counts on an empty findings table."""
+        totals = self.db.get_finding_totals()
+        self.assertEqual(totals.to_dict(), {
+            "subdomain": 0, "live_domain": 0, "findings": 0, "info": 0,
+        })
 
 
 class TestForeignKeyConstraints(unittest.TestCase):
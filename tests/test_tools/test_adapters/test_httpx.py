@@ -8,7 +8,7 @@ import json
 import unittest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from galehuntui.core.models import (
     ToolConfig,
@@ -272,26 +272,21 @@ class TestHttpxAdapter(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(tool_path, self.bin_path / "httpx")
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('pathlib.Path.stat')
-    async def test_check_available_success(self, mock_stat, mock_is_file, mock_exists):
+    @patch('os.path.isfile')
+    @patch('os.access')
+    async def test_check_available_success(self, mock_access, mock_isfile):
         """Test check_available returns True when tool exists."""
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        # Mock executable file (0o755)
-        mock_stat_result = MagicMock()
-        mock_stat_result.st_mode = 0o100755
-        mock_stat.return_value = mock_stat_result
+        mock_isfile.return_value = True
+        mock_access.return_value = True
 
         available = await self.adapter.check_available()
 
         self.assertTrue(available)
 
-    @patch('pathlib.Path.exists')
-    async def test_check_available_not_found(self, mock_exists):
+    @patch('os.path.isfile')
+    async def test_check_available_not_found(self, mock_isfile):
         """Test check_available returns False when tool not found."""
-        mock_exists.return_value = False
+        mock_isfile.return_value = False
 
         available = await self.adapter.check_available()
 
@@ -0,0 +1,59 @@
+"""Unit tests for SqlmapAdapter output parsing.
+
+Tests detection of confirmed injections in SQLMap text output without
+requiring the actual sqlmap binary to be installed.
+"""
+
+import unittest
+from pathlib import Path
+
+from galehuntui.tools.adapters.sqlmap import SqlmapAdapter
+
+
+CLEAN_SCAN = """\
+[10:00:00] [INFO] testing URL 'http://example.com/item.php?id=1'
+[10:00:00] [INFO] testing connection to the target URL
+[10:00:01] [INFO] testing if GET parameter 'id' is dynamic
+[10:00:01] [WARNING] heuristic (basic) test shows that GET parameter 'id' might not be injectable
+[10:00:02] [INFO] testing 'AND boolean-based blind - WHERE or HAVING clause'
+[10:00:05] [WARNING] GET parameter 'id' does not seem to be injectable
+[10:00:05] [CRITICAL] all tested parameters do not appear to be injectable. Try to increase values for '--level'/'--risk' options
+"""
+
+VULNERABLE_SCAN = """\
+[10:00:00] [INFO] testing URL 'http://example.com/item.php?id=1'
+[10:00:01] [INFO] heuristic (basic) test shows that GET parameter 'id' might be injectable
+[10:00:02] [INFO] GET parameter 'id' appears to be 'AND boolean-based blind - WHERE or HAVING clause' injectable
+GET parameter 'id' is vulnerable. Do you want to keep testing the others (if any)? [y/N] N
+"""
+
+
+class TestSqlmapParseOutput(unittest.TestCase):
+    """Test cases for SqlmapAdapter.parse_output."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.adapter = SqlmapAdapter(Path("/mock/tools/bin"))
+
+    def test_parse_empty_output(self):
+        """Test parsing empty output."""
+        self.assertEqual(self.adapter.parse_output(""), [])
+
+    def test_parse_clean_scan_has_no_findings(self):
+        """Test negative and heuristic messages are not reported."""
+        self.assertEqual(self.adapter.parse_output(CLEAN_SCAN), [])
+
+    def test_parse_confirmed_injection(self):
+        """Test confirmed injection lines produce findings."""
+        findings = self.adapter.parse_output(VULNERABLE_SCAN)
+
+        self.assertEqual(len(findings), 2)
+        for finding in findings:
+            self.assertEqual(finding.url, "http://example.com/item.php?id=1")
+            self.assertEqual(finding.host, "example.com")
+            self.assertEqual(finding.tool, "sqlmap")
+        self.assertEqual(findings[0].type, "sqli-boolean-blind")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,7 @@ import json
 import unittest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from galehuntui.core.models import (
     ToolConfig,
@@ -319,6 +319,17 @@ class TestSubfinderAdapter(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(findings[0].host, "sub0.example.com")
         self.assertEqual(findings[99].host, "sub99.example.com")
 
+    def test_new_output_path_unique(self):
+        """Test output paths share one scratch directory and never repeat."""
+        first = self.adapter._new_output_path(".jsonl")
+        second = self.adapter._new_output_path(".jsonl")
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(first.parent, second.parent)
+        self.assertTrue(first.parent.is_dir())
+        self.assertTrue(first.name.startswith("subfinder_"))
+        self.assertEqual(first.suffix, ".jsonl")
+
     @patch('pathlib.Path.exists')
     def test_get_tool_path(self, mock_exists):
         """Test getting tool path."""
@@ -326,58 +337,63 @@ class TestSubfinderAdapter(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(tool_path, self.bin_path / "subfinder")
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('pathlib.Path.stat')
-    async def test_check_available_success(self, mock_stat, mock_is_file, mock_exists):
+    @patch('os.path.isfile')
+    @patch('os.access')
+    async def test_check_available_success(self, mock_access, mock_isfile):
         """Test check_available returns True when tool exists."""
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        # Mock executable file (0o755)
-        mock_stat_result = MagicMock()
-        mock_stat_result.st_mode = 0o100755
-        mock_stat.return_value = mock_stat_result
+        mock_isfile.return_value = True
+        mock_access.return_value = True
 
         available = await self.adapter.check_available()
 
         self.assertTrue(available)
 
-    @patch('pathlib.Path.exists')
-    async def test_check_available_not_found(self, mock_exists):
+    @patch('os.path.isfile')
+    async def test_check_available_not_found(self, mock_isfile):
         """Test check_available returns False when tool not found."""
-        mock_exists.return_value = False
+        mock_isfile.return_value = False
 
         available = await self.adapter.check_available()
 
         self.assertFalse(available)
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    async def test_check_available_not_file(self, mock_is_file, mock_exists):
+    @patch('os.path.isfile')
+    @patch('os.access')
+    async def test_check_available_not_file(self, mock_access, mock_isfile):
         """Test check_available returns False when path is not a file."""
-        mock_exists.return_value = True
-        mock_is_file.return_value = False
+        mock_isfile.return_value = False
+        mock_access.return_value = True
 
         available = await self.adapter.check_available()
 
         self.assertFalse(available)
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('pathlib.Path.stat')
-    async def test_check_available_not_executable(self, mock_stat, mock_is_file, mock_exists):
+    @patch('os.path.isfile')
+    @patch('os.access')
+    async def test_check_available_not_executable(self, mock_access, mock_isfile):
         """Test check_available returns False when file is not executable."""
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        # Mock non-executable file (0o644)
-        mock_stat_result = MagicMock()
-        mock_stat_result.st_mode = 0o100644
-        mock_stat.return_value = mock_stat_result
+        mock_isfile.return_value = True
+        mock_access.return_value = False
 
         available = await self.adapter.check_available()
 
         self.assertFalse(available)
 
+    @patch('os.path.isfile')
+    @patch('os.access')
+    async def test_check_available_caches_only_success(self, mock_access, mock_isfile):
+        """Test a missing tool is re-checked but a found tool is cached."""
+        mock_isfile.return_value = True
+        mock_access.return_value = False
+
+        self.assertFalse(await self.adapter.check_available())
+
+        mock_access.return_value = True
+        self.assertTrue(await self.adapter.check_available())
+
+        mock_isfile.return_value = False
+        self.assertTrue(await self.adapter.check_available())
+        self.assertEqual(mock_access.call_count, 2)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,171 @@
+"""Unit tests for TemplateManager's severity/tag index.
+
+Builds a small nuclei-templates checkout in a temporary directory, so
+no real template repository is needed.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from galehuntui.tools.deps.manager import DependencyManager
+from galehuntui.tools.deps.templates import TemplateManager, _parse_info
+
+
+INLINE_TEMPLATE = b"""\
+id: inline-tags
+
+info:
+  name: Inline Tags
+  author: test
+  severity: high
+  tags: cve,RCE, 'apache'
+"""
+
+BLOCK_TEMPLATE = b"""\
+id: block-tags
+
+info:
+  name: Block Tags
+  author: test
+  severity: "Medium"
+  tags:
+    - xss
+    - 'reflected'
+    - Generic
+
+http:
+  - method: GET
+    path:
+      - "{{BaseURL}}"
+"""
+
+
+class TestParseInfo(unittest.TestCase):
+    """Test cases for _parse_info."""
+
+    def test_inline_tags(self):
+        """Test tags written inline as a comma-separated list."""
+        self.assertEqual(
+            _parse_info(INLINE_TEMPLATE),
+            ("high", ["cve", "rce", "apache"]),
+        )
+
+    def test_flow_list_tags(self):
+        """Test tags written as a YAML flow list."""
+        data = b"info:\n  severity: low\n  tags: [dns, 'takeover']\n"
+        self.assertEqual(_parse_info(data), ("low", ["dns", "takeover"]))
+
+    def test_block_list_tags(self):
+        """Test tags written as a YAML block list."""
+        severity, tags = _parse_info(BLOCK_TEMPLATE)
+        self.assertEqual(severity, "medium")
+        self.assertEqual(tags, ["xss", "reflected", "generic"])
+
+    def test_block_list_tags_crlf(self):
+        """Test block-list tags in a file with CRLF line endings."""
+        data = BLOCK_TEMPLATE.replace(b"\n", b"\r\n")
+        self.assertEqual(_parse_info(data)[1], ["xss", "reflected", "generic"])
+
+    def test_missing_fields(self):
+        """Test a template without severity or tags."""
+        self.assertEqual(_parse_info(b"id: bare\ninfo:\n  name: Bare\n"), ("", []))
+
+
+class TestTemplateIndex(unittest.TestCase):
+    """Test cases for the persistent template index."""
+
+    def setUp(self):
+        """Set up a temporary nuclei-templates checkout."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        deps_dir = Path(self._tmp.name)
+        self.base = deps_dir / "templates" / "nuclei-templates"
+        (self.base / "http").mkdir(parents=True)
+        (self.base / ".git").mkdir()
+        self.git_index = self.base / ".git" / "index"
+        self.git_index.write_bytes(b"")
+        (self.base / "http" / "inline.yaml").write_bytes(INLINE_TEMPLATE)
+        (self.base / "http" / "block.yaml").write_bytes(BLOCK_TEMPLATE)
+        self.deps_manager = DependencyManager(deps_dir)
+        self.manager = TemplateManager(self.deps_manager)
+
+    def _names(self, paths):
+        return sorted(path.name for path in paths)
+
+    def _bump_git_index(self):
+        # Simulate a git update rewriting .git/index
+        stat = self.git_index.stat()
+        os.utime(self.git_index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_query_by_severity_and_tag(self):
+        """Test severity and tag lookups from both tag styles."""
+        self.assertEqual(
+            self._names(self.manager.get_templates_by_severity("HIGH")),
+            ["inline.yaml"],
+        )
+        self.assertEqual(
+            self._names(self.manager.get_templates_by_tag("xss")),
+            ["block.yaml"],
+        )
+        self.assertEqual(
+            self._names(self.manager.get_templates_by_tag("cve")),
+            ["inline.yaml"],
+        )
+
+    def test_index_persisted(self):
+        """Test the index is written to disk and reused by a new manager."""
+        self.manager.build_index()
+        index = json.loads(self.manager.index_path.read_text())
+        self.assertEqual(index["by_severity"]["medium"], ["http/block.yaml"])
+
+        # A fresh manager reads the stored index instead of rescanning
+        index["by_tag"]["stored-only"] = ["http/inline.yaml"]
+        self.manager.index_path.write_text(json.dumps(index))
+        fresh = TemplateManager(self.deps_manager)
+        self.assertEqual(
+            self._names(fresh.get_templates_by_tag("stored-only")),
+            ["inline.yaml"],
+        )
+
+    def test_index_invalidated_on_change(self):
+        """Test a template change after an update rebuilds the index."""
+        self.assertEqual(
+            self._names(self.manager.get_templates_by_tag("xss")),
+            ["block.yaml"],
+        )
+
+        (self.base / "http" / "block.yaml").write_bytes(
+            BLOCK_TEMPLATE.replace(b"- xss", b"- sqli")
+        )
+        self._bump_git_index()
+
+        self.assertEqual(self.manager.get_templates_by_tag("xss"), [])
+        self.assertEqual(
+            self._names(self.manager.get_templates_by_tag("sqli")),
+            ["block.yaml"],
+        )
+        # The rebuilt index is also what a new manager loads from disk
+        fresh = TemplateManager(self.deps_manager)
+        self.assertEqual(fresh.get_templates_by_tag("xss"), [])
+
+    def test_corrupt_index_rebuilt(self):
+        """Test an unreadable index file is rebuilt from the templates."""
+        self.manager.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manager.index_path.write_text("{not json")
+        self.assertEqual(
+            self._names(self.manager.get_templates_by_severity("medium")),
+            ["block.yaml"],
+        )
+
+    def test_no_templates_installed(self):
+        """Test lookups when nuclei-templates is missing."""
+        manager = TemplateManager(DependencyManager(Path(self._tmp.name) / "empty"))
+        self.assertEqual(manager.get_templates_by_tag("xss"), [])
+        self.assertEqual(manager.get_templates_by_severity("high"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()